@@ -1,10 +1,55 @@
-from typing import List
+import ast
+import asyncio
+import math
+import operator
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Type
 
 from dotenv import load_dotenv
 from spaik_sdk.agent.base_agent import BaseAgent
 from spaik_sdk.models.llm_model import LLMModel
 from spaik_sdk.tools.tool_provider import BaseTool, ToolProvider, tool
 
+_BINARY_OPERATORS: Dict[Type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+}
+_UNARY_OPERATORS: Dict[Type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+_FUNCTIONS: Dict[str, Callable[[float], float]] = {
+    "sqrt": math.sqrt,
+}
+# Deletes every character that may appear in a valid expression; anything left over is rejected up front
+_DELETE_ALLOWED_CHARS = str.maketrans("", "", "0123456789+-*/.() " + "".join(_FUNCTIONS))
+
+
+@lru_cache(maxsize=512)
+def _evaluate_expression(expression: str) -> Any:
+    # Expressions are pure arithmetic, so repeated ones are answered without re-parsing or re-walking
+    return _eval_node(ast.parse(expression.strip(), mode="eval").body)
+
+
+def _eval_node(node: ast.expr) -> Any:
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        return node.value
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](_eval_node(node.left), _eval_node(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_eval_node(node.operand))
+    if (
+        isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Name)
+        and node.func.id in _FUNCTIONS
+        and len(node.args) == 1
+        and not node.keywords
+    ):
+        return _FUNCTIONS[node.func.id](_eval_node(node.args[0]))
+    raise ValueError(f"Unsupported syntax '{type(node).__name__}'. Only numbers, +, -, *, /, (, ) and sqrt() are allowed.")
+
 
 @tool
 def calculator(expression: str) -> str:
@@ -13,21 +58,11 @@ def calculator(expression: str) -> str:
     Args:
         expression: Mathematical expression to evaluate (e.g., '2+2', '10*5', 'sqrt(16)')
     """
+    disallowed = expression.translate(_DELETE_ALLOWED_CHARS)
+    if disallowed:
+        return f"Error evaluating '{expression}': Unsupported characters {sorted(set(disallowed))}"
     try:
-        # Simple safe evaluation - only allow basic math operations
-        if "sqrt" in expression:
-            import math
-            # Replace sqrt with math.sqrt
-            expression = expression.replace("sqrt", "math.sqrt")
-            result = eval(expression, {"__builtins__": {}, "math": math})
-        else:
-            # Basic arithmetic only
-            allowed_chars = set("0123456789+-*/.() ")
-            if not all(c in allowed_chars for c in expression):
-                return f"Error: Invalid characters in expression '{expression}'. Only numbers and +, -, *, /, (, ) are allowed."
-            
-            result = eval(expression, {"__builtins__": {}})
-        
+        result = _evaluate_expression(expression)
         return f"Result: {result}"
     except Exception as e:
         return f"Error evaluating '{expression}': {str(e)}"
@@ -73,6 +108,23 @@ class OllamaAgent(BaseAgent):
         return [CalculatorToolProvider()]
 
 
+DEMO_PROMPTS = [
+    ("Basic Response", "Hello! What can you help me with?"),
+    ("Tool Calling Test", "What is 15 * 7 + 12?"),
+    ("Reasoning + Tool Test", "I have a rectangle with length 12.5 and width 8.3. What's its area and perimeter?"),
+]
+
+
+async def run_demo() -> None:
+    # Each prompt gets its own agent (and thread) so the generations can overlap
+    # instead of paying the Ollama round trip three times in a row
+    responses = await asyncio.gather(*(OllamaAgent().get_response_text_async(prompt) for _, prompt in DEMO_PROMPTS))
+    for (title, _), response in zip(DEMO_PROMPTS, responses):
+        print(f"=== {title} ===")
+        print(response)
+        print()
+
+
 if __name__ == "__main__":
     load_dotenv()
     
@@ -83,26 +135,8 @@ if __name__ == "__main__":
     print("3. Set OLLAMA_BASE_URL if not using localhost:11434")
     print()
     
-    agent = OllamaAgent()
-    
-    # Test basic response
-    print("=== Basic Response ===")
-    response = agent.get_response_text("Hello! What can you help me with?")
-    print(response)
-    print()
-    
-    # Test tool calling
-    print("=== Tool Calling Test ===")
-    response = agent.get_response_text("What is 15 * 7 + 12?")
-    print(response)
-    print()
-    
-    # Test reasoning with complex math
-    print("=== Reasoning + Tool Test ===")
-    response = agent.get_response_text("I have a rectangle with length 12.5 and width 8.3. What's its area and perimeter?")
-    print(response)
-    print()
+    asyncio.run(run_demo())
     
     # Interactive CLI (uncomment to use)
     # print("Starting interactive CLI...")
-    # agent.run_cli()
+    # OllamaAgent().run_cli()
@@ -1,46 +1,90 @@
-import asyncio
-from contextlib import asynccontextmanager
-from typing import AsyncIterator, List
+from typing import List
 
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from spaik_sdk.agent.base_agent import BaseAgent
 from spaik_sdk.attachments import get_or_create_file_storage
-from spaik_sdk.image_gen import ImageGenerator, ImageGenOptions, ImageFormat
+from spaik_sdk.image_gen import ImageGenerator, ImageGenOptions, ImageFormat, generate_filename
 from spaik_sdk.models.model_registry import ModelRegistry
-from spaik_sdk.server.api.routers.api_builder import ApiBuilder
+from spaik_sdk.server.app_factory import make_app
 from spaik_sdk.tools.tool_provider import BaseTool, ToolProvider, tool
 
 load_dotenv()
 
+@tool
+def get_secret_greeting() -> str:
+    """Returns the users secret greeting."""
+    return "kikkelis kokkelis"
+
+
+@tool
+def get_user_name() -> str:
+    """Returns the users name."""
+    return "Seppo Hovi"
+
+
+@tool
+def search_web(query: str, limit: int = 5) -> str:
+    """Search the web for information.
+    
+    Args:
+        query: The search query string
+        limit: Maximum number of results to return (default 5)
+    
+    Returns:
+        Search results as formatted text
+    """
+    return f"Found {limit} results for '{query}':\n1. Example result 1\n2. Example result 2\n3. Example result 3"
+
+
+@tool
+async def generate_image(prompt: str) -> str:
+    """
+    Generate an image based on a text prompt and store it in the file service.
+    
+    After calling this tool, you MUST include the image in your response using:
+    <StoredImage id="THE_FILE_ID_RETURNED" />
+    
+    This will render the generated image inline in your message.
+    
+    Args:
+        prompt: A detailed description of the image to generate.
+                Be specific about style, content, colors, composition, etc.
+    
+    Returns:
+        The file ID of the stored image. Use this ID with <StoredImage id="..." /> tag.
+    """
+    # Get the file storage instance
+    file_storage = get_or_create_file_storage()
+    
+    # Create image generator (uses env var for model, defaults to gpt-image-1)
+    generator = ImageGenerator(
+        model="gpt-image-1",  # OpenAI's DALL-E model
+    )
+    
+    # Generate the image
+    options = ImageGenOptions(
+        width=1024,
+        height=1024,
+        output_format=ImageFormat.PNG,
+    )
+    
+    image_bytes = await generator.generate_image_bytes(prompt=prompt, options=options)
+    
+    # Store the image directly in the file service, no temp file needed
+    # Use "system" as owner for agent-generated content (readable by all users)
+    metadata = await file_storage.store(
+        image_bytes,
+        mime_type="image/png",
+        owner_id="system",
+        filename=generate_filename(prompt, options.output_format),
+    )
+    
+    return metadata.file_id
+
 
 class DemoTool(ToolProvider):
     def get_tools(self) -> List[BaseTool]:
-        @tool
-        def get_secret_greeting() -> str:
-            """Returns the users secret greeting."""
-            return "kikkelis kokkelis"
-
-        @tool
-        def get_user_name() -> str:
-            """Returns the users name."""
-            return "Seppo Hovi"
-
-        @tool
-        def search_web(query: str, limit: int = 5) -> str:
-            """Search the web for information.
-            
-            Args:
-                query: The search query string
-                limit: Maximum number of results to return (default 5)
-            
-            Returns:
-                Search results as formatted text
-            """
-            return f"Found {limit} results for '{query}':\n1. Example result 1\n2. Example result 2\n3. Example result 3"
-
         return [get_secret_greeting, get_user_name, search_web]
 
 
@@ -48,58 +92,6 @@ class ImageGeneratorTool(ToolProvider):
     """Tool provider for generating and storing images."""
 
     def get_tools(self) -> List[BaseTool]:
-        @tool
-        async def generate_image(prompt: str) -> str:
-            """
-            Generate an image based on a text prompt and store it in the file service.
-            
-            After calling this tool, you MUST include the image in your response using:
-            <StoredImage id="THE_FILE_ID_RETURNED" />
-            
-            This will render the generated image inline in your message.
-            
-            Args:
-                prompt: A detailed description of the image to generate.
-                        Be specific about style, content, colors, composition, etc.
-            
-            Returns:
-                The file ID of the stored image. Use this ID with <StoredImage id="..." /> tag.
-            """
-            # Get the file storage instance
-            file_storage = get_or_create_file_storage()
-            
-            # Create image generator (uses env var for model, defaults to gpt-image-1)
-            generator = ImageGenerator(
-                model="gpt-image-1",  # OpenAI's DALL-E model
-                output_dir="/tmp/agent-images",
-            )
-            
-            # Generate the image
-            options = ImageGenOptions(
-                width=1024,
-                height=1024,
-                output_format=ImageFormat.PNG,
-            )
-            
-            image_path = await generator.generate_image(prompt=prompt, options=options)
-            
-            # Read the image bytes and store via file service
-            image_bytes = image_path.read_bytes()
-            
-            # Store in file service
-            # Use "system" as owner for agent-generated content (readable by all users)
-            metadata = await file_storage.store(
-                data=image_bytes,
-                mime_type="image/png",
-                owner_id="system",
-                filename=image_path.name,
-            )
-            
-            # Clean up temp file
-            image_path.unlink(missing_ok=True)
-            
-            return metadata.file_id
-
         return [generate_image]
 
 
@@ -131,28 +123,11 @@ class MinimalAgent(BaseAgent):
     pass
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    agent = DemoAgent(llm_model=ModelRegistry.CLAUDE_4_SONNET)
-
-    api_builder = ApiBuilder.local(agent=agent)
-    thread_router = api_builder.build_thread_router()
-    file_router = api_builder.build_file_router()
-    audio_router = api_builder.build_audio_router()  # TTS/STT endpoints
-    app.include_router(thread_router)
-    app.include_router(file_router)
-    app.include_router(audio_router)
-    yield
-
-
-app = FastAPI(title="Agent SDK Backend Example", version="0.0.1", lifespan=lifespan)
-
-app.add_middleware(
-    CORSMiddleware,  # type: ignore[arg-type]
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+app = make_app(
+    lambda: DemoAgent(llm_model=ModelRegistry.CLAUDE_4_SONNET),
+    title="Agent SDK Backend Example",
+    include_files=True,
+    include_audio=True,  # TTS/STT endpoints
 )
 
 
@@ -3,20 +3,22 @@ import contextvars
 import threading
 import uuid
 from abc import ABC
-from typing import Any, AsyncGenerator, Dict, List, Optional, Type, TypeVar
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, List, Mapping, Optional, Type, TypeVar
 
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
-from langgraph.graph.state import CompiledStateGraph
 from pydantic import BaseModel
 
 from spaik_sdk.attachments.models import Attachment
 from spaik_sdk.config.env import env_config
 from spaik_sdk.llm.cancellation_handle import CancellationHandle
+from spaik_sdk.llm.consumption.token_usage import TokenUsage
 from spaik_sdk.llm.cost.builtin_cost_provider import BuiltinCostProvider
 from spaik_sdk.llm.cost.cost_estimate import CostEstimate
 from spaik_sdk.llm.cost.cost_provider import CostProvider
 from spaik_sdk.llm.langchain_service import LangChainService
+from spaik_sdk.llm.response_cache import ResponseCache, ResponseCacheStats
 from spaik_sdk.models.llm_config import LLMConfig
 from spaik_sdk.models.llm_model import LLMModel
 from spaik_sdk.models.providers.provider_type import ProviderType
@@ -33,16 +35,23 @@ from spaik_sdk.tools.tool_provider import ToolProvider
 from spaik_sdk.tracing.agent_trace import AgentTrace
 from spaik_sdk.tracing.trace_sink import TraceSink
 from spaik_sdk.utils.init_logger import init_logger
+from spaik_sdk.utils.sync_runner import run_sync
+
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
 
 logger = init_logger(__name__)
 
 T = TypeVar("T", bound=BaseModel)
 
+_EMPTY_PROMPT_ARGS: Mapping[str, Any] = MappingProxyType({})
+_ZERO_USAGE = TokenUsage(input_tokens=0, output_tokens=0)
+
 
 class BaseAgent(ABC):
     def __init__(
         self,
-        system_prompt_args: Dict[str, Any] = {},
+        system_prompt_args: Optional[Mapping[str, Any]] = None,
         system_prompt_version: Optional[str] = None,
         system_prompt: Optional[str] = None,
         prompt_loader: Optional[PromptLoader] = None,
@@ -58,15 +67,15 @@ class BaseAgent(ABC):
         recorder: Optional[ConditionalRecorder] = None,
         cancellation_handle: Optional[CancellationHandle] = None,
         cost_provider: Optional[CostProvider] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         logger.debug("Initializing BaseAgent")
         # Generate unique instance ID for trace correlation
         self.agent_instance_id: str = str(uuid.uuid4())
         self.tool_providers = tool_providers if tool_providers is not None else self.get_tool_providers()
         self.prompt_loader = prompt_loader if prompt_loader is not None else get_prompt_loader(prompt_loader_mode)
-        self.system_prompt = (
-            system_prompt if system_prompt is not None else self._get_system_prompt(system_prompt_args, system_prompt_version)
-        )
+        prompt_args = system_prompt_args if system_prompt_args is not None else _EMPTY_PROMPT_ARGS
+        self.system_prompt = system_prompt if system_prompt is not None else self._get_system_prompt(prompt_args, system_prompt_version)
         self.trace = (
             trace
             if trace is not None
@@ -86,6 +95,9 @@ class BaseAgent(ABC):
         self.thread_container.subscribe(self._on_thread_event)
         self.cancellation_handle = cancellation_handle
         self.cost_provider = cost_provider if cost_provider is not None else BuiltinCostProvider()
+        self.response_cache = response_cache
+        self._structured_llm_config: Optional[LLMConfig] = None
+        self._structured_llm_config_source: Optional[LLMConfig] = None
 
     def get_response_stream(
         self,
@@ -102,18 +114,23 @@ class BaseAgent(ABC):
         attachments: Optional[List[Attachment]] = None,
     ) -> AsyncGenerator[ThreadEvent, None]:
         event_adapter = EventAdapter(self.thread_container)
-        async for _event in self.get_response_stream(user_input, attachments):
-            new_events = event_adapter.flush()
-            for new_event in new_events:
-                yield new_event
-        event_adapter.cleanup()
+        pending_events = event_adapter.events
+        try:
+            async for _event in self.get_response_stream(user_input, attachments):
+                while pending_events:
+                    yield pending_events.popleft()
+            # Deliver events emitted after the last stream chunk as well
+            while pending_events:
+                yield pending_events.popleft()
+        finally:
+            event_adapter.cleanup()
 
     def get_response(
         self,
         user_input: Optional[str] = None,
         attachments: Optional[List[Attachment]] = None,
     ) -> ThreadMessage:
-        return asyncio.run(self.get_response_async(user_input, attachments))
+        return run_sync(self.get_response_async(user_input, attachments))
 
     async def get_response_async(
         self,
@@ -180,14 +197,20 @@ class BaseAgent(ABC):
 
     def get_structured_response(self, prompt: str, output_schema: Type[T]) -> T:
         self.trace.add_structured_response_input(prompt, output_schema)
-        llm_config = self.llm_config.as_structured_response_config()
-        langchain_service = self._create_langchain_service(llm_config)
+        langchain_service = self._create_langchain_service(self._get_structured_llm_config())
         ret = langchain_service.get_structured_response(prompt, output_schema)
         self.trace.add_structured_response_output(ret)
         return ret
 
+    async def get_structured_response_async(self, prompt: str, output_schema: Type[T]) -> T:
+        self.trace.add_structured_response_input(prompt, output_schema)
+        langchain_service = self._create_langchain_service(self._get_structured_llm_config())
+        ret = await langchain_service.get_structured_response_async(prompt, output_schema)
+        self.trace.add_structured_response_output(ret)
+        return ret
+
     def run_cli(self):
-        asyncio.run(LiveCLI(self.thread_container).run_interactive(self))
+        run_sync(LiveCLI(self.thread_container).run_interactive(self))
 
     def create_llm_config(self, llm_model: Optional[LLMModel] = None, reasoning: Optional[bool] = None) -> LLMConfig:
         if llm_model is None:
@@ -225,10 +248,10 @@ class BaseAgent(ABC):
     def set_cancellation_handle(self, cancellation_handle: Optional[CancellationHandle]) -> None:
         self.cancellation_handle = cancellation_handle
 
-    def _get_prompt(self, prompt_name: str, args: Dict[str, Any], version: Optional[str] = None) -> str:
+    def _get_prompt(self, prompt_name: str, args: Mapping[str, Any], version: Optional[str] = None) -> str:
         return self.prompt_loader.get_agent_prompt(self.__class__, prompt_name, args, version)
 
-    def _get_system_prompt(self, args: Dict[str, Any], version: Optional[str] = None) -> str:
+    def _get_system_prompt(self, args: Mapping[str, Any], version: Optional[str] = None) -> str:
         return self.prompt_loader.get_system_prompt(self.__class__, args, version)
 
     def _create_tools(self, tool_providers: Optional[List[ToolProvider]] = None) -> List[BaseTool]:
@@ -236,12 +259,20 @@ class BaseAgent(ABC):
         tools = []
         for provider in tool_providers:
             provider_id = provider.get_provider_id()
-            for tool in provider.get_tools():
+            for tool in provider.tools:
                 setattr(tool, "_spaik_tool_provider_id", provider_id)
                 setattr(tool, "_spaik_tool_provider", provider)
                 tools.append(tool)
         return tools
 
+    def _get_structured_llm_config(self) -> LLMConfig:
+        # Keep the derived config (and the model client it lazily builds) across calls;
+        # rebuild only when llm_config has been swapped out.
+        if self._structured_llm_config is None or self._structured_llm_config_source is not self.llm_config:
+            self._structured_llm_config = self.llm_config.as_structured_response_config()
+            self._structured_llm_config_source = self.llm_config
+        return self._structured_llm_config
+
     def _create_langchain_service(self, llm_config: Optional[LLMConfig] = None) -> LangChainService:
         if self.thread_container is None:
             raise ValueError("Thread container is not set")
@@ -254,6 +285,7 @@ class BaseAgent(ABC):
             self.recorder,
             self.playback,
             self.cancellation_handle,
+            self.response_cache,
         )
 
     def _on_thread_event(self, event: ThreadEvent) -> None:
@@ -263,15 +295,20 @@ class BaseAgent(ABC):
             self.trace.add_block(event.block)
 
     def get_cost(self, latest_only: bool = False) -> CostEstimate:
-        token_usage = self.thread_container.get_total_consumption()
         if latest_only:
             token_usage = self.thread_container.get_latest_token_usage()
+        else:
+            token_usage = self.thread_container.get_total_consumption()
         if token_usage is None:
-            from spaik_sdk.llm.consumption.token_usage import TokenUsage
-
-            token_usage = TokenUsage(input_tokens=0, output_tokens=0)
+            token_usage = _ZERO_USAGE
         return self.cost_provider.get_cost_estimate(self.get_llm_model(), token_usage)
 
+    def get_cache_stats(self) -> Optional[ResponseCacheStats]:
+        """Get hit/miss statistics of the response cache, or None if no cache is configured."""
+        if self.response_cache is None:
+            return None
+        return self.response_cache.stats()
+
     def get_langchain_model(self) -> BaseChatModel:
         """Get the underlying LangChain chat model.
 
@@ -283,7 +320,7 @@ class BaseAgent(ABC):
         """
         return self.llm_config.get_model_wrapper().get_langchain_model()
 
-    def get_react_agent(self) -> CompiledStateGraph:
+    def get_react_agent(self) -> "CompiledStateGraph":
         """Get a LangGraph react agent with the agent's tools and model.
 
         Returns a compiled LangGraph react agent that can be used directly
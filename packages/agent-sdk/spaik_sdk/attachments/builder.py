@@ -1,3 +1,4 @@
+import asyncio
 from pathlib import Path
 from typing import List, Optional, Union
 
@@ -5,6 +6,8 @@ from spaik_sdk.attachments.mime_types import guess_mime_type
 from spaik_sdk.attachments.models import Attachment
 from spaik_sdk.attachments.storage.base_file_storage import BaseFileStorage
 
+MAX_CONCURRENT_UPLOADS = 16
+
 
 class AttachmentBuilder:
     def __init__(self, file_storage: BaseFileStorage):
@@ -26,8 +29,7 @@ class AttachmentBuilder:
             if mime_type is None:
                 raise ValueError(f"Could not determine MIME type for: {path}")
 
-        with open(path, "rb") as f:
-            data = f.read()
+        data = await asyncio.to_thread(path.read_bytes)
 
         metadata = await self.file_storage.store(
             data=data,
@@ -43,7 +45,13 @@ class AttachmentBuilder:
         paths: List[Union[str, Path]],
         owner_id: str = "system",
     ) -> List[Attachment]:
-        return [await self.from_path(p, owner_id=owner_id) for p in paths]
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+
+        async def bounded_from_path(path: Union[str, Path]) -> Attachment:
+            async with semaphore:
+                return await self.from_path(path, owner_id=owner_id)
+
+        return list(await asyncio.gather(*(bounded_from_path(p) for p in paths)))
 
     async def from_bytes(
         self,
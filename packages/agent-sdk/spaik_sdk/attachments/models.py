@@ -31,7 +31,7 @@ class FileMetadata:
     mime_type: str
     owner_id: str
     size_bytes: int
-    created_at: int = field(default_factory=lambda: int(time.time() * 1000))
+    created_at: int = field(default_factory=lambda: time.time_ns() // 1_000_000)
     filename: Optional[str] = None
 
     def to_dict(self) -> Dict[str, Any]:
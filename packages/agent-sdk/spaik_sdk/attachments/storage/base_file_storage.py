@@ -1,8 +1,11 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import AsyncIterable, List, Optional, Sequence
 
 from spaik_sdk.attachments.models import FileMetadata
 
+MAX_CONCURRENT_RETRIEVES = 8
+
 
 class BaseFileStorage(ABC):
     @abstractmethod
@@ -15,10 +18,42 @@ class BaseFileStorage(ABC):
     ) -> FileMetadata:
         pass
 
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        mime_type: str,
+        owner_id: str,
+        filename: Optional[str] = None,
+    ) -> FileMetadata:
+        """Store content delivered as a stream of chunks.
+
+        The default implementation buffers the chunks and delegates to store(); backends
+        that can write incrementally should override it to avoid holding the whole file in memory.
+        """
+        data = b"".join([chunk async for chunk in chunks])
+        return await self.store(data=data, mime_type=mime_type, owner_id=owner_id, filename=filename)
+
     @abstractmethod
     async def retrieve(self, file_id: str) -> tuple[bytes, FileMetadata]:
         pass
 
+    async def retrieve_many(self, file_ids: Sequence[str]) -> List[Optional[tuple[bytes, FileMetadata]]]:
+        """Retrieve several files at once, in the order of file_ids; missing files map to None.
+
+        The default implementation runs retrieve() concurrently; backends with a batched read
+        (a multi-key GET, SELECT ... IN) should override it to fetch everything in one round-trip.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_RETRIEVES)
+
+        async def retrieve_one(file_id: str) -> Optional[tuple[bytes, FileMetadata]]:
+            async with semaphore:
+                try:
+                    return await self.retrieve(file_id)
+                except FileNotFoundError:
+                    return None
+
+        return list(await asyncio.gather(*(retrieve_one(file_id) for file_id in file_ids)))
+
     @abstractmethod
     async def get_metadata(self, file_id: str) -> Optional[FileMetadata]:
         pass
@@ -1,7 +1,9 @@
+import asyncio
 import json
+import os
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterable, Optional
 
 from spaik_sdk.attachments.models import FileMetadata
 from spaik_sdk.attachments.storage.base_file_storage import BaseFileStorage
@@ -26,6 +28,11 @@ class LocalFileStorage(BaseFileStorage):
         with open(self._metadata_path(metadata.file_id), "w") as f:
             json.dump(metadata.to_dict(), f)
 
+    def _write_file(self, metadata: FileMetadata, data: bytes) -> None:
+        with open(self._file_path(metadata.file_id), "wb") as f:
+            f.write(data)
+        self._save_metadata(metadata)
+
     def _load_metadata(self, file_id: str) -> Optional[FileMetadata]:
         metadata_path = self._metadata_path(file_id)
         if not metadata_path.exists():
@@ -45,10 +52,6 @@ class LocalFileStorage(BaseFileStorage):
     ) -> FileMetadata:
         file_id = str(uuid.uuid4())
 
-        file_path = self._file_path(file_id)
-        with open(file_path, "wb") as f:
-            f.write(data)
-
         metadata = FileMetadata(
             file_id=file_id,
             mime_type=mime_type,
@@ -56,7 +59,44 @@ class LocalFileStorage(BaseFileStorage):
             size_bytes=len(data),
             filename=filename,
         )
-        self._save_metadata(metadata)
+        await asyncio.to_thread(self._write_file, metadata, data)
+
+        return metadata
+
+    async def store_stream(
+        self,
+        chunks: AsyncIterable[bytes],
+        mime_type: str,
+        owner_id: str,
+        filename: Optional[str] = None,
+    ) -> FileMetadata:
+        file_id = str(uuid.uuid4())
+
+        # Write under a temp name and rename only once the metadata is saved, so a failed stream never leaves a visible file
+        size_bytes = 0
+        part_path = self.files_dir / f".{file_id}.part"
+        try:
+            f = await asyncio.to_thread(open, part_path, "wb")
+            try:
+                async for chunk in chunks:
+                    await asyncio.to_thread(f.write, chunk)
+                    size_bytes += len(chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+
+            metadata = FileMetadata(
+                file_id=file_id,
+                mime_type=mime_type,
+                owner_id=owner_id,
+                size_bytes=size_bytes,
+                filename=filename,
+            )
+            await asyncio.to_thread(self._save_metadata, metadata)
+            await asyncio.to_thread(os.replace, part_path, self._file_path(file_id))
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            self._metadata_path(file_id).unlink(missing_ok=True)
+            raise
 
         return metadata
 
@@ -65,12 +105,10 @@ class LocalFileStorage(BaseFileStorage):
         if metadata is None:
             raise FileNotFoundError(f"File not found: {file_id}")
 
-        file_path = self._file_path(file_id)
-        if not file_path.exists():
-            raise FileNotFoundError(f"File content not found: {file_id}")
-
-        with open(file_path, "rb") as f:
-            data = f.read()
+        try:
+            data = await asyncio.to_thread(self._file_path(file_id).read_bytes)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File content not found: {file_id}") from None
 
         return data, metadata
 
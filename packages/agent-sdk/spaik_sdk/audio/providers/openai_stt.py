@@ -1,9 +1,18 @@
-import httpx
+import os
 
 from spaik_sdk.audio.options import STTOptions
+from spaik_sdk.utils import http_client
 
 OPENAI_STT_ENDPOINT = "https://api.openai.com/v1/audio/transcriptions"
 
+_CONTENT_TYPE_BY_EXT = {
+    ".mp3": "audio/mpeg",
+    ".wav": "audio/wav",
+    ".m4a": "audio/mp4",
+    ".ogg": "audio/ogg",
+    ".webm": "audio/webm",
+}
+
 
 async def transcribe(
     audio_bytes: bytes,
@@ -38,15 +47,7 @@ async def transcribe(
         request_headers.update(headers)
 
     # Determine content type from filename
-    content_type = "audio/webm"
-    if filename.endswith(".mp3"):
-        content_type = "audio/mpeg"
-    elif filename.endswith(".wav"):
-        content_type = "audio/wav"
-    elif filename.endswith(".m4a"):
-        content_type = "audio/mp4"
-    elif filename.endswith(".ogg"):
-        content_type = "audio/ogg"
+    content_type = _CONTENT_TYPE_BY_EXT.get(os.path.splitext(filename)[1].lower(), "audio/webm")
 
     # Build multipart form data
     files = {
@@ -64,8 +65,7 @@ async def transcribe(
     if options.temperature > 0:
         data["temperature"] = str(options.temperature)
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(url, headers=request_headers, files=files, data=data)
-        if response.status_code != 200:
-            raise ValueError(f"OpenAI STT API error {response.status_code}: {response.text}")
-        return response.text.strip()
+    response = await http_client.post(url, request_headers, files=files, data=data)
+    if response.status_code != 200:
+        raise ValueError(f"OpenAI STT API error {response.status_code}: {response.text}")
+    return response.text.strip()
@@ -1,34 +1,31 @@
 from collections.abc import AsyncIterator
-
-import httpx
+from typing import Final
 
 from spaik_sdk.audio.options import AudioFormat, TTSOptions
+from spaik_sdk.utils import http_client
 
 OPENAI_TTS_ENDPOINT = "https://api.openai.com/v1/audio/speech"
 
 
-def _get_format_map() -> dict[AudioFormat, str]:
-    return {
-        AudioFormat.MP3: "mp3",
-        AudioFormat.OPUS: "opus",
-        AudioFormat.AAC: "aac",
-        AudioFormat.FLAC: "flac",
-        AudioFormat.WAV: "wav",
-        AudioFormat.PCM: "pcm",
-    }
+_FORMAT_MAP: Final[dict[AudioFormat, str]] = {
+    AudioFormat.MP3: "mp3",
+    AudioFormat.OPUS: "opus",
+    AudioFormat.AAC: "aac",
+    AudioFormat.FLAC: "flac",
+    AudioFormat.WAV: "wav",
+    AudioFormat.PCM: "pcm",
+}
 
 
 def _build_payload(text: str, model: str, options: TTSOptions) -> dict:
-    format_map = _get_format_map()
-    payload: dict = {
+    return {
         "model": model,
         "input": text,
         "voice": options.voice,
-        "response_format": format_map.get(options.output_format, "mp3"),
+        "response_format": _FORMAT_MAP.get(options.output_format, "mp3"),
         "speed": options.speed,
+        **options.vendor,
     }
-    payload.update(options.vendor)
-    return payload
 
 
 def _build_headers(api_key: str, extra_headers: dict[str, str] | None = None) -> dict[str, str]:
@@ -67,11 +64,10 @@ async def synthesize(
     request_headers = _build_headers(api_key, headers)
     payload = _build_payload(text, model, options)
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        response = await client.post(url, headers=request_headers, json=payload)
-        if response.status_code != 200:
-            raise ValueError(f"OpenAI TTS API error {response.status_code}: {response.text}")
-        return response.content
+    response = await http_client.post(url, request_headers, json=payload)
+    if response.status_code != 200:
+        raise ValueError(f"OpenAI TTS API error {response.status_code}: {response.text}")
+    return response.content
 
 
 async def synthesize_stream(
@@ -102,10 +98,9 @@ async def synthesize_stream(
     request_headers = _build_headers(api_key, headers)
     payload = _build_payload(text, model, options)
 
-    async with httpx.AsyncClient(timeout=120.0) as client:
-        async with client.stream("POST", url, headers=request_headers, json=payload) as response:
-            if response.status_code != 200:
-                content = await response.aread()
-                raise ValueError(f"OpenAI TTS API error {response.status_code}: {content.decode()}")
-            async for chunk in response.aiter_bytes(chunk_size=4096):
-                yield chunk
+    async with http_client.stream_post(url, request_headers, json=payload) as response:
+        if response.status_code != 200:
+            content = await response.aread()
+            raise ValueError(f"OpenAI TTS API error {response.status_code}: {content.decode()}")
+        async for chunk in response.aiter_bytes(chunk_size=4096):
+            yield chunk
@@ -1,5 +1,6 @@
 import os
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Tuple
 from typing import Optional as OptionalType
 
 from spaik_sdk.models.llm_model import LLMModel
@@ -9,6 +10,18 @@ from spaik_sdk.prompt.prompt_loader_mode import PromptLoaderMode
 from spaik_sdk.tracing.trace_sink_mode import TraceSinkMode
 
 
+# Values are still read from os.environ on every call (load_dotenv may run after import and
+# tests patch the environment); only the parsing of a given raw value is memoized.
+@lru_cache(maxsize=32)
+def _parse_debug_modes(raw: str) -> FrozenSet[str]:
+    return frozenset(raw.split(","))
+
+
+@lru_cache(maxsize=32)
+def _parse_headers(raw: str) -> Tuple[Tuple[str, str], ...]:
+    return tuple((name, value) for name, value in (h.split(":", 1) for h in raw.split(",") if ":" in h))
+
+
 class EnvConfig:
     def get_key(self, key: str, default: str = "", required: bool = True) -> str:
         value = os.environ.get(key, default)
@@ -28,7 +41,7 @@ class EnvConfig:
     def is_debug_mode(self, key: str) -> bool:
         debug_modes = self.get_key("DEBUG_MODES", required=False)
         if debug_modes:
-            return key in debug_modes.split(",")
+            return key in _parse_debug_modes(debug_modes)
         return False
 
     def get_prompts_dir(self) -> str:
@@ -54,6 +67,10 @@ class EnvConfig:
     def get_image_model(self) -> str:
         return self.get_key("IMAGE_MODEL")
 
+    def get_http_client_backend(self) -> str:
+        """Get the HTTP client used for provider REST calls: 'httpx' (default) or 'aiohttp'."""
+        return self.get_key("HTTP_CLIENT_BACKEND", "httpx", required=False)
+
     # ── LLM proxy configuration ──────────────────────────────────────────
 
     def get_llm_auth_mode(self) -> str:
@@ -73,7 +90,7 @@ class EnvConfig:
         raw = self.get_key("LLM_PROXY_HEADERS", "", required=False)
         if not raw:
             return {}
-        return dict(h.split(":", 1) for h in raw.split(",") if ":" in h)
+        return dict(_parse_headers(raw))
 
 
 env_config = EnvConfig()
@@ -1,9 +1,13 @@
+from typing import Optional
+
 from spaik_sdk.config.credentials_provider import CredentialsProvider
 from spaik_sdk.config.env import env_config
 from spaik_sdk.config.env_credentials_provider import EnvCredentialsProvider
 
+_credentials_provider: Optional[CredentialsProvider] = None
 
-def get_credentials_provider() -> CredentialsProvider:
+
+def _build_credentials_provider() -> CredentialsProvider:
     provider_type = env_config.get_credentials_provider_type()
     if provider_type == "env":
         return EnvCredentialsProvider()
@@ -11,4 +15,22 @@ def get_credentials_provider() -> CredentialsProvider:
         raise ValueError(f"Unsupported provider type: {provider_type}")
 
 
-credentials_provider = get_credentials_provider()
+def get_credentials_provider() -> CredentialsProvider:
+    """Return the shared credentials provider, built on first use rather than at import time."""
+    global _credentials_provider
+    if _credentials_provider is None:
+        _credentials_provider = _build_credentials_provider()
+    return _credentials_provider
+
+
+class _LazyCredentialsProvider(CredentialsProvider):
+    """Delegates to get_credentials_provider(), so CREDENTIALS_PROVIDER_TYPE is read on the first key lookup."""
+
+    def get_key(self, key: str, default: str = "", required: bool = True) -> str:
+        return get_credentials_provider().get_key(key, default, required)
+
+    def get_provider_key(self, provider: str) -> str:
+        return get_credentials_provider().get_provider_key(provider)
+
+
+credentials_provider: CredentialsProvider = _LazyCredentialsProvider()
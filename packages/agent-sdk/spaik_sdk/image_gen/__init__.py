@@ -1,4 +1,4 @@
-from spaik_sdk.image_gen.image_generator import ImageGenerator
+from spaik_sdk.image_gen.image_generator import ImageGenerator, generate_filename
 from spaik_sdk.image_gen.options import ImageFormat, ImageGenOptions, ImageQuality
 
 __all__ = [
@@ -6,4 +6,5 @@ __all__ = [
     "ImageGenOptions",
     "ImageQuality",
     "ImageFormat",
+    "generate_filename",
 ]
@@ -1,4 +1,6 @@
+import asyncio
 import re
+from functools import lru_cache
 from pathlib import Path
 from time import time
 
@@ -8,20 +10,32 @@ from spaik_sdk.image_gen.options import ImageFormat, ImageGenOptions
 from spaik_sdk.image_gen.providers import google as google_provider
 from spaik_sdk.image_gen.providers import openai as openai_provider
 
+_NON_SLUG_CHARS = re.compile(r"[^a-zA-Z0-9]+")
+
 
 def _slugify(text: str, max_length: int = 50) -> str:
-    slug = re.sub(r"[^a-zA-Z0-9]+", "_", text.lower())
+    slug = _NON_SLUG_CHARS.sub("_", text.lower())
     slug = slug.strip("_")
     return slug[:max_length]
 
 
-def _generate_filename(prompt: str, output_format: ImageFormat) -> str:
+def generate_filename(prompt: str, output_format: ImageFormat) -> str:
     slug = _slugify(prompt)
     timestamp = int(time())
     extension = output_format.value
     return f"{slug}_{timestamp}.{extension}"
 
 
+@lru_cache(maxsize=32)
+def _provider_for_model(model: str) -> str:
+    if model.startswith("gpt-image"):
+        return "openai"
+    elif model.startswith("gemini"):
+        return "google"
+    else:
+        raise ValueError(f"Unknown image model provider for: {model}")
+
+
 class ImageGenerator:
     def __init__(
         self,
@@ -36,19 +50,13 @@ class ImageGenerator:
         self.headers = headers
 
     def _get_provider(self) -> str:
-        if self.model.startswith("gpt-image"):
-            return "openai"
-        elif self.model.startswith("gemini"):
-            return "google"
-        else:
-            raise ValueError(f"Unknown image model provider for: {self.model}")
+        return _provider_for_model(self.model)
 
-    async def generate_image(
+    async def generate_image_bytes(
         self,
         prompt: str,
         options: ImageGenOptions | None = None,
-        output_filename: str | None = None,
-    ) -> Path:
+    ) -> bytes:
         opts = options or ImageGenOptions()
         provider = self._get_provider()
 
@@ -75,9 +83,22 @@ class ImageGenerator:
         else:
             raise ValueError(f"Unsupported provider: {provider}")
 
-        filename = output_filename or _generate_filename(prompt, opts.output_format)
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        return image_bytes
+
+    async def generate_image(
+        self,
+        prompt: str,
+        options: ImageGenOptions | None = None,
+        output_filename: str | None = None,
+    ) -> Path:
+        opts = options or ImageGenOptions()
+        image_bytes = await self.generate_image_bytes(prompt, opts)
+
+        filename = output_filename or generate_filename(prompt, opts.output_format)
         output_path = self.output_dir / filename
+        await asyncio.to_thread(self._write_image, output_path, image_bytes)
+        return output_path
 
+    def _write_image(self, output_path: Path, image_bytes: bytes) -> None:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(image_bytes)
-        return output_path
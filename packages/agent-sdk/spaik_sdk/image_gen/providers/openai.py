@@ -1,4 +1,5 @@
 import base64
+from typing import Final
 
 import httpx
 
@@ -6,6 +7,12 @@ from spaik_sdk.image_gen.options import ImageFormat, ImageGenOptions
 
 OPENAI_IMAGES_ENDPOINT = "https://api.openai.com/v1/images/generations"
 
+_OUTPUT_FORMAT_MAP: Final[dict[ImageFormat, str]] = {
+    ImageFormat.PNG: "png",
+    ImageFormat.JPEG: "jpeg",
+    ImageFormat.WEBP: "webp",
+}
+
 
 async def generate_image(
     prompt: str,
@@ -26,18 +33,12 @@ async def generate_image(
 
     size = f"{options.width}x{options.height}"
 
-    response_format_map = {
-        ImageFormat.PNG: "png",
-        ImageFormat.JPEG: "jpeg",
-        ImageFormat.WEBP: "webp",
-    }
-
     payload: dict = {
         "model": model,
         "prompt": prompt,
         "size": size,
         "quality": options.quality.value,
-        "output_format": response_format_map[options.output_format],
+        "output_format": _OUTPUT_FORMAT_MAP[options.output_format],
         "n": 1,
     }
     payload.update(options.vendor)
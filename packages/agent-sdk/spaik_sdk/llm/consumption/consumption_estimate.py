@@ -4,7 +4,7 @@ from typing import Any, Dict
 from spaik_sdk.llm.consumption.token_usage import TokenUsage
 
 
-@dataclass
+@dataclass(slots=True)
 class ConsumptionEstimate:
     """Consumption estimation for a request."""
 
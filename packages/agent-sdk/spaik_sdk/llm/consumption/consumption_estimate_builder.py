@@ -6,6 +6,8 @@ from spaik_sdk.utils.init_logger import init_logger
 
 logger = init_logger(__name__)
 
+_CHARS_PER_TOKEN = 4
+
 
 class ConsumptionEstimateBuilder:
     """Builder for creating consumption estimates from various data sources."""
@@ -85,11 +87,12 @@ class ConsumptionEstimateBuilder:
 
     def estimate_from_content(self, content: str) -> "ConsumptionEstimateBuilder":
         """Rough estimation when no usage metadata is available."""
-        if not content or self._token_usage:
+        if self._token_usage or len(content) < _CHARS_PER_TOKEN:
+            # Nothing to estimate: real usage is already known, or the content rounds to zero tokens
             return self
 
         # Very rough token estimation (4 chars per token average)
-        estimated_output_tokens = len(content) // 4
+        estimated_output_tokens = len(content) // _CHARS_PER_TOKEN
         estimated_input_tokens = estimated_output_tokens * 5
 
         self._token_usage = TokenUsage(
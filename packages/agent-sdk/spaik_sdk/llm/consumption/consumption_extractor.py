@@ -1,3 +1,4 @@
+import logging
 from typing import Any, Dict, Optional
 
 from spaik_sdk.llm.consumption.consumption_estimate import ConsumptionEstimate
@@ -54,6 +55,8 @@ class ConsumptionExtractor:
                 f"(in: {consumption_estimate.token_usage.input_tokens}, out: {consumption_estimate.token_usage.output_tokens}, "
                 f"reasoning: {consumption_estimate.token_usage.reasoning_tokens}{cache_info})"
             )
-            logger.debug(f"📊 Full consumption data: {consumption_estimate.to_dict()}")
+            # %s only defers formatting; the guard is what skips building the dict
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📊 Full consumption data: %s", consumption_estimate.to_dict())
 
         return consumption_estimate
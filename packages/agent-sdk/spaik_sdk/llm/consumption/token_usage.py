@@ -1,8 +1,8 @@
-from dataclasses import dataclass
-from typing import Any, Mapping
+from dataclasses import dataclass, fields
+from typing import Any, Dict, Mapping
 
 
-@dataclass
+@dataclass(slots=True)
 class TokenUsage:
     input_tokens: int = 0
     output_tokens: int = 0
@@ -15,6 +15,15 @@ class TokenUsage:
         if self.total_tokens == 0:
             self.total_tokens = self.input_tokens + self.output_tokens
 
+    # Pickle as a plain dict, the same state the class had before it used __slots__, so persisted
+    # threads stay loadable in both directions.
+    def __getstate__(self) -> Dict[str, int]:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+    def __setstate__(self, state: Mapping[str, int]) -> None:
+        for f in fields(self):
+            setattr(self, f.name, state.get(f.name, 0))
+
     @classmethod
     def from_langchain(cls, usage: Mapping[str, Any]) -> "TokenUsage":
         """Create TokenUsage from LangChain usage_metadata."""
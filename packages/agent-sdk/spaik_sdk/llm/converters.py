@@ -1,5 +1,9 @@
+import asyncio
 import base64
-from typing import Any, Dict, List, Optional, Union, cast
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Union, cast
 
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
 
@@ -10,15 +14,33 @@ from spaik_sdk.thread.models import MessageBlock, MessageBlockType, ThreadMessag
 from spaik_sdk.tools.tool_provider import ToolProvider
 from spaik_sdk.utils.init_logger import init_logger
 
+try:
+    # SIMD base64 encoding for large attachments, used when pybase64 is installed. It returns the
+    # str directly, skipping the extra full-size bytes -> str copy of the stdlib path.
+    from pybase64 import b64encode_as_string  # type: ignore[import-not-found]
+except ImportError:
+
+    def b64encode_as_string(s: bytes) -> str:
+        return base64.b64encode(s).decode("ascii")
+
+
 logger = init_logger(__name__)
 
+# Stored files never change under a file_id, so the base64 payload of an attachment is kept per
+# storage and reused on later turns instead of re-reading and re-encoding the file every time.
+# The cache is bounded by total payload size too, and large payloads are not cached at all.
+_ENCODED_ATTACHMENTS_MAX_ENTRIES = 32
+_ENCODED_ATTACHMENTS_MAX_BYTES = 64 * 1024 * 1024
+_ENCODED_ATTACHMENT_MAX_CACHED_BYTES = 8 * 1024 * 1024
+_encoded_attachments: "weakref.WeakKeyDictionary[BaseFileStorage, OrderedDict[str, str]]" = weakref.WeakKeyDictionary()
+_encoded_attachments_lock = threading.Lock()
+
 
 def convert_thread_message_to_langchain(
     thread_message: ThreadMessage,
     include_author_name: bool = False,
 ) -> BaseMessage:
-    processed_blocks = [_process_message_block(block) for block in thread_message.blocks]
-    content = "\n".join(filter(None, processed_blocks))
+    content = _render_blocks(thread_message.blocks)
     author_prefix = f"{'[' + thread_message.author_name + ']: ' if include_author_name else ''}"
     if thread_message.ai:
         return AIMessage(content=f"{author_prefix}{content}")
@@ -32,8 +54,7 @@ async def convert_thread_message_to_langchain_multimodal(
     provider_family: str = "openai",
     include_author_name: bool = False,
 ) -> BaseMessage:
-    processed_blocks = [_process_message_block(block) for block in thread_message.blocks]
-    text_content = "\n".join(filter(None, processed_blocks))
+    text_content = _render_blocks(thread_message.blocks)
     author_prefix = f"{'[' + thread_message.author_name + ']: ' if include_author_name else ''}"
 
     if thread_message.ai:
@@ -47,6 +68,11 @@ async def convert_thread_message_to_langchain_multimodal(
     if text_content:
         content_parts.append({"type": "text", "text": f"{author_prefix}{text_content}"})
 
+    supported_file_ids = [
+        attachment.file_id for attachment in thread_message.attachments if is_supported_by_provider(attachment.mime_type, provider_family)
+    ]
+    encoded_attachments = await _get_encoded_attachments(supported_file_ids, file_storage)
+
     for attachment in thread_message.attachments:
         # Check if MIME type is supported by the provider
         if not is_supported_by_provider(attachment.mime_type, provider_family):
@@ -60,10 +86,9 @@ async def convert_thread_message_to_langchain_multimodal(
             )
             content_parts.append({"type": "text", "text": fallback_msg})
             continue
-
-        attachment_content = await _convert_attachment_to_content_part(attachment, file_storage, provider_family)
-        if attachment_content:
-            content_parts.append(attachment_content)
+        b64_data = encoded_attachments.get(attachment.file_id)
+        if b64_data is not None:
+            content_parts.append(_convert_attachment_to_content_part(attachment, b64_data, provider_family))
 
     if not content_parts:
         return HumanMessage(content="")
@@ -71,18 +96,12 @@ async def convert_thread_message_to_langchain_multimodal(
     return HumanMessage(content=cast(List[Union[str, Dict[str, Any]]], content_parts))
 
 
-async def _convert_attachment_to_content_part(
+def _convert_attachment_to_content_part(
     attachment: Attachment,
-    file_storage: BaseFileStorage,
+    b64_data: str,
     provider_family: str = "openai",
-) -> Optional[Dict[str, Any]]:
-    try:
-        data, metadata = await file_storage.retrieve(attachment.file_id)
-    except FileNotFoundError:
-        return None
-
+) -> Dict[str, Any]:
     mime_type = attachment.mime_type
-    b64_data = base64.b64encode(data).decode("utf-8")
 
     if mime_type.startswith("image/"):
         if provider_family == "anthropic":
@@ -121,28 +140,80 @@ async def _convert_attachment_to_content_part(
         }
 
 
+async def _get_encoded_attachments(file_ids: List[str], file_storage: BaseFileStorage) -> Dict[str, str]:
+    """Return the base64 payload per file_id, reading every uncached file in one retrieve_many() call."""
+    encoded: Dict[str, str] = {}
+    with _encoded_attachments_lock:
+        cache = _encoded_attachments.setdefault(file_storage, OrderedDict())
+        for file_id in file_ids:
+            b64_data = cache.get(file_id)
+            if b64_data is not None:
+                cache.move_to_end(file_id)
+                encoded[file_id] = b64_data
+
+    # A cached file may have been deleted since; only serve hits that are still in storage
+    if encoded:
+        cached_ids = list(encoded)
+        still_exists = await asyncio.gather(*(file_storage.exists(file_id) for file_id in cached_ids))
+        deleted = [file_id for file_id, exists in zip(cached_ids, still_exists) if not exists]
+        if deleted:
+            with _encoded_attachments_lock:
+                for file_id in deleted:
+                    cache.pop(file_id, None)
+                    del encoded[file_id]
+
+    missing = list(dict.fromkeys(file_id for file_id in file_ids if file_id not in encoded))
+    if not missing:
+        return encoded
+
+    results = await file_storage.retrieve_many(missing)
+    fetched = {file_id: b64encode_as_string(result[0]) for file_id, result in zip(missing, results) if result is not None}
+
+    with _encoded_attachments_lock:
+        cache.update((file_id, b64_data) for file_id, b64_data in fetched.items() if len(b64_data) <= _ENCODED_ATTACHMENT_MAX_CACHED_BYTES)
+        # base64 is ASCII, so the string length is the payload size in bytes
+        cached_bytes = sum(len(b64_data) for b64_data in cache.values())
+        while len(cache) > _ENCODED_ATTACHMENTS_MAX_ENTRIES or cached_bytes > _ENCODED_ATTACHMENTS_MAX_BYTES:
+            _, evicted = cache.popitem(last=False)
+            cached_bytes -= len(evicted)
+    encoded.update(fetched)
+    return encoded
+
+
+_AUDIO_FORMAT_BY_MIME_TYPE: Dict[str, str] = {
+    "audio/mpeg": "mp3",
+    "audio/mp3": "mp3",
+    "audio/wav": "wav",
+    "audio/ogg": "ogg",
+    "audio/webm": "webm",
+}
+
+
 def _get_audio_format(mime_type: str) -> str:
-    format_map = {
-        "audio/mpeg": "mp3",
-        "audio/mp3": "mp3",
-        "audio/wav": "wav",
-        "audio/ogg": "ogg",
-        "audio/webm": "webm",
-    }
-    return format_map.get(mime_type, "wav")
+    return _AUDIO_FORMAT_BY_MIME_TYPE.get(mime_type, "wav")
+
+
+def _render_tool_use_block(block: MessageBlock) -> str:
+    if block.tool_provider is None:
+        return ToolProvider.render_tool_call_details(block)
+    return block.tool_provider.render_tool_block_for_history(block)
+
+
+def _render_content_block(block: MessageBlock) -> str:
+    return block.content or ""
+
+
+_BLOCK_RENDERERS: Dict[MessageBlockType, Callable[[MessageBlock], str]] = {
+    MessageBlockType.REASONING: lambda block: "<thinking/>",
+    MessageBlockType.TOOL_USE: _render_tool_use_block,
+    MessageBlockType.ERROR: lambda block: f'<error msg="{block.content or "unknown error"}"/>',
+    MessageBlockType.PLAIN: _render_content_block,
+}
 
 
 def _process_message_block(block: MessageBlock) -> str:
-    if block.type == MessageBlockType.REASONING:
-        return "<thinking/>"
-    elif block.type == MessageBlockType.TOOL_USE:
-        if block.tool_provider is None:
-            return ToolProvider.render_tool_call_details(block)
-        return block.tool_provider.render_tool_block_for_history(block)
-    elif block.type == MessageBlockType.ERROR:
-        content = block.content or "unknown error"
-        return f'<error msg="{content}"/>'
-    elif block.type == MessageBlockType.PLAIN:
-        return block.content or ""
-    else:
-        return block.content or ""
+    return _BLOCK_RENDERERS.get(block.type, _render_content_block)(block)
+
+
+def _render_blocks(blocks: List[MessageBlock]) -> str:
+    return "\n".join(text for text in map(_process_message_block, blocks) if text)
@@ -1,127 +1,96 @@
+from functools import lru_cache
+from typing import Optional, Tuple
+
 from spaik_sdk.llm.consumption.token_usage import TokenUsage
 from spaik_sdk.llm.cost.cost_provider import CostProvider
 from spaik_sdk.models.llm_model import LLMModel
 
+# USD cents per million tokens: (input, output, reasoning, cache_creation, cache_read)
+_Pricing = Tuple[int, int, int, int, int]
 
-class BuiltinCostProvider(CostProvider):
-    def get_token_pricing(self, model: LLMModel) -> TokenUsage:
-        """Get token pricing in USD cents per million tokens."""
-        name = model.name
+_UNKNOWN_MODEL_PRICING: _Pricing = (0, 0, 0, 0, 0)
 
-        # Anthropic Claude models
-        if name.startswith("claude-3-7-sonnet"):
-            # Claude 3.7 Sonnet: $3.00 input, $15.00 output per 1M tokens
-            return TokenUsage(
-                input_tokens=300,  # $3.00 in cents per 1M tokens
-                output_tokens=1500,  # $15.00 in cents per 1M tokens
-                reasoning_tokens=0,
-                cache_creation_tokens=375,  # 25% markup on input for cache creation
-                cache_read_tokens=30,  # 10% of input cost for cache reads
-            )
-        elif name.startswith("claude-sonnet-4") or name.startswith("claude-4-sonnet"):
-            # Claude 4 Sonnet (all versions): $3.00 input, $15.00 output per 1M tokens
-            return TokenUsage(input_tokens=300, output_tokens=1500, reasoning_tokens=0, cache_creation_tokens=375, cache_read_tokens=30)
-        elif name.startswith("claude-opus-4-5") or name.startswith("claude-opus-4-6") or name.startswith("claude-opus-4-7"):
-            # Claude Opus 4.5 / 4.6 / 4.7: $5.00 input, $25.00 output per 1M tokens
-            return TokenUsage(input_tokens=500, output_tokens=2500, reasoning_tokens=0, cache_creation_tokens=625, cache_read_tokens=50)
-        elif name.startswith("claude-opus-4") or name.startswith("claude-4-opus"):
-            # Claude Opus 4 / 4.1: $15.00 input, $75.00 output per 1M tokens
-            return TokenUsage(input_tokens=1500, output_tokens=7500, reasoning_tokens=0, cache_creation_tokens=1875, cache_read_tokens=150)
+# (name prefix, required substring, pricing), checked in order; the first matching rule wins,
+# so more specific prefixes must come before the prefixes they extend.
+_PRICING_RULES: Tuple[Tuple[str, Optional[str], _Pricing], ...] = (
+    # Anthropic Claude models
+    # Claude 3.7 Sonnet: $3.00 input, $15.00 output; cache creation at 25% markup, cache reads at 10% of input
+    ("claude-3-7-sonnet", None, (300, 1500, 0, 375, 30)),
+    # Claude 4 Sonnet (all versions): $3.00 input, $15.00 output
+    ("claude-sonnet-4", None, (300, 1500, 0, 375, 30)),
+    ("claude-4-sonnet", None, (300, 1500, 0, 375, 30)),
+    # Claude Opus 4.5 / 4.6 / 4.7: $5.00 input, $25.00 output
+    ("claude-opus-4-5", None, (500, 2500, 0, 625, 50)),
+    ("claude-opus-4-6", None, (500, 2500, 0, 625, 50)),
+    ("claude-opus-4-7", None, (500, 2500, 0, 625, 50)),
+    # Claude Opus 4 / 4.1: $15.00 input, $75.00 output
+    ("claude-opus-4", None, (1500, 7500, 0, 1875, 150)),
+    ("claude-4-opus", None, (1500, 7500, 0, 1875, 150)),
+    # OpenAI models — legacy (deprecated on OpenAI direct API, still available on Azure)
+    # GPT-4.1: $2.00 input, $8.00 output
+    ("gpt-4.1", None, (200, 800, 0, 250, 20)),
+    # GPT-4o: $2.50 input, $10.00 output
+    ("gpt-4o", None, (250, 1000, 0, 312, 25)),
+    # O1-Pro: $150.00 input, $600.00 output
+    ("o1-pro", None, (15000, 60000, 0, 0, 0)),
+    # O4-mini: $0.40 input, $1.60 output; 110% markup for reasoning tokens
+    ("o4-mini", None, (40, 160, 440, 50, 4)),
+    # OpenAI models — current
+    # GPT-5.5 Pro: $30.00 input, $180.00 output
+    ("gpt-5.5-pro", None, (3000, 18000, 18000, 0, 0)),
+    # GPT-5.5: $5.00 input, $30.00 output
+    ("gpt-5.5", None, (500, 3000, 3000, 625, 50)),
+    # GPT-5.4 Pro: $30.00 input, $180.00 output
+    ("gpt-5.4-pro", None, (3000, 18000, 18000, 0, 0)),
+    # GPT-5.4 Nano: $0.20 input, $1.25 output
+    ("gpt-5.4-nano", None, (20, 125, 125, 25, 2)),
+    # GPT-5.4 Mini: $0.75 input, $4.50 output
+    ("gpt-5.4-mini", None, (75, 450, 450, 94, 7)),
+    # GPT-5.4: $2.50 input, $15.00 output
+    ("gpt-5.4", None, (250, 1500, 1500, 312, 25)),
+    # GPT-5 Nano: $0.05 input, $0.40 output; 10% markup for reasoning, cache reads at $0.005 per 1M tokens
+    ("gpt-5", "nano", (5, 40, 44, 6, 0)),
+    # GPT-5 Mini: $0.25 input, $2.00 output; 10% markup for reasoning, 90% discount on cache reads
+    ("gpt-5", "mini", (25, 200, 220, 31, 2)),
+    # GPT-5: $1.25 input, $10.00 output; 10% markup for reasoning, 90% discount on cache reads
+    ("gpt-5", None, (125, 1000, 1100, 156, 12)),
+    # Google Gemini models
+    # Gemini 2.5 Flash-Lite: $0.05 input, $0.20 output
+    ("gemini-2.5-flash-lite", None, (5, 20, 0, 6, 0)),
+    # Gemini 2.5 Flash: $0.15 input, $0.60 output
+    ("gemini-2.5-flash", None, (15, 60, 0, 19, 1)),
+    # Gemini 2.5 Pro: $1.25 input, $10.00 output
+    ("gemini-2.5-pro", None, (125, 1000, 0, 156, 12)),
+    # Gemini 3.5 Flash: $1.50 input, $9.00 output
+    ("gemini-3.5-flash", None, (150, 900, 0, 188, 15)),
+    # Gemini 3.1 Pro: $2.00 input, $12.00 output for prompts <= 200k tokens
+    ("gemini-3.1-pro", None, (200, 1200, 0, 250, 20)),
+    # Gemini 3.1 Flash-Lite: $0.25 input, $1.50 output
+    ("gemini-3.1-flash-lite", None, (25, 150, 0, 31, 2)),
+    # Gemini 3 Pro: $1.25 input, $10.00 output (deprecated on Google API March 9, 2026)
+    ("gemini-3-pro", None, (125, 1000, 0, 156, 12)),
+    # Gemini 3 Flash: $0.50 input, $3.00 output
+    ("gemini-3-flash", None, (50, 300, 0, 62, 5)),
+)
 
-        # OpenAI models — legacy (deprecated on OpenAI direct API, still available on Azure)
-        elif name.startswith("gpt-4.1"):
-            # GPT-4.1: $2.00 input, $8.00 output per 1M tokens
-            return TokenUsage(input_tokens=200, output_tokens=800, reasoning_tokens=0, cache_creation_tokens=250, cache_read_tokens=20)
-        elif name.startswith("gpt-4o"):
-            # GPT-4o: $2.50 input, $10.00 output per 1M tokens
-            return TokenUsage(input_tokens=250, output_tokens=1000, reasoning_tokens=0, cache_creation_tokens=312, cache_read_tokens=25)
-        elif name.startswith("o1-pro"):
-            # O1-Pro: $150.00 input, $600.00 output per 1M tokens
-            return TokenUsage(input_tokens=15000, output_tokens=60000, reasoning_tokens=0, cache_creation_tokens=0, cache_read_tokens=0)
-        elif name.startswith("o4-mini"):
-            # O4-mini: $0.40 input, $1.60 output per 1M tokens
-            return TokenUsage(
-                input_tokens=40,
-                output_tokens=160,
-                reasoning_tokens=440,  # 110% markup for reasoning tokens
-                cache_creation_tokens=50,
-                cache_read_tokens=4,
-            )
 
-        # OpenAI models — current
-        elif name.startswith("gpt-5.5-pro"):
-            # GPT-5.5 Pro: $30.00 input, $180.00 output per 1M tokens
-            return TokenUsage(input_tokens=3000, output_tokens=18000, reasoning_tokens=18000, cache_creation_tokens=0, cache_read_tokens=0)
-        elif name.startswith("gpt-5.5"):
-            # GPT-5.5: $5.00 input, $30.00 output per 1M tokens
-            return TokenUsage(input_tokens=500, output_tokens=3000, reasoning_tokens=3000, cache_creation_tokens=625, cache_read_tokens=50)
-        elif name.startswith("gpt-5.4-pro"):
-            # GPT-5.4 Pro: $30.00 input, $180.00 output per 1M tokens
-            return TokenUsage(input_tokens=3000, output_tokens=18000, reasoning_tokens=18000, cache_creation_tokens=0, cache_read_tokens=0)
-        elif name.startswith("gpt-5.4-nano"):
-            # GPT-5.4 Nano: $0.20 input, $1.25 output per 1M tokens
-            return TokenUsage(input_tokens=20, output_tokens=125, reasoning_tokens=125, cache_creation_tokens=25, cache_read_tokens=2)
-        elif name.startswith("gpt-5.4-mini"):
-            # GPT-5.4 Mini: $0.75 input, $4.50 output per 1M tokens
-            return TokenUsage(input_tokens=75, output_tokens=450, reasoning_tokens=450, cache_creation_tokens=94, cache_read_tokens=7)
-        elif name.startswith("gpt-5.4"):
-            # GPT-5.4: $2.50 input, $15.00 output per 1M tokens
-            return TokenUsage(input_tokens=250, output_tokens=1500, reasoning_tokens=1500, cache_creation_tokens=312, cache_read_tokens=25)
-        elif name.startswith("gpt-5"):
-            if "nano" in name:
-                # GPT-5 Nano: $0.05 input, $0.40 output per 1M tokens
-                return TokenUsage(
-                    input_tokens=5,
-                    output_tokens=40,
-                    reasoning_tokens=44,  # 10% markup for reasoning
-                    cache_creation_tokens=6,  # 25% markup on input for cache creation
-                    cache_read_tokens=0,  # 90% discount: $0.005 per 1M tokens
-                )
-            elif "mini" in name:
-                # GPT-5 Mini: $0.25 input, $2.00 output per 1M tokens
-                return TokenUsage(
-                    input_tokens=25,
-                    output_tokens=200,
-                    reasoning_tokens=220,  # 10% markup for reasoning
-                    cache_creation_tokens=31,  # 25% markup on input for cache creation
-                    cache_read_tokens=2,  # 90% discount: $0.025 per 1M tokens
-                )
-            else:
-                # GPT-5: $1.25 input, $10.00 output per 1M tokens
-                return TokenUsage(
-                    input_tokens=125,
-                    output_tokens=1000,
-                    reasoning_tokens=1100,  # 10% markup for reasoning
-                    cache_creation_tokens=156,  # 25% markup on input for cache creation
-                    cache_read_tokens=12,  # 90% discount: $0.125 per 1M tokens
-                )
+@lru_cache(maxsize=128)
+def _pricing_for_name(name: str) -> _Pricing:
+    for prefix, substring, pricing in _PRICING_RULES:
+        if name.startswith(prefix) and (substring is None or substring in name):
+            return pricing
+    # Default fallback for unknown models
+    return _UNKNOWN_MODEL_PRICING
 
-        # Google Gemini models
-        elif name.startswith("gemini-2.5-flash-lite"):
-            # Gemini 2.5 Flash-Lite: $0.05 input, $0.20 output per 1M tokens
-            return TokenUsage(input_tokens=5, output_tokens=20, reasoning_tokens=0, cache_creation_tokens=6, cache_read_tokens=0)
-        elif name.startswith("gemini-2.5-flash"):
-            # Gemini 2.5 Flash: $0.15 input, $0.60 output per 1M tokens
-            return TokenUsage(input_tokens=15, output_tokens=60, reasoning_tokens=0, cache_creation_tokens=19, cache_read_tokens=1)
-        elif name.startswith("gemini-2.5-pro"):
-            # Gemini 2.5 Pro: $1.25 input, $10.00 output per 1M tokens
-            return TokenUsage(input_tokens=125, output_tokens=1000, reasoning_tokens=0, cache_creation_tokens=156, cache_read_tokens=12)
-        elif name.startswith("gemini-3.5-flash"):
-            # Gemini 3.5 Flash: $1.50 input, $9.00 output per 1M tokens
-            return TokenUsage(input_tokens=150, output_tokens=900, reasoning_tokens=0, cache_creation_tokens=188, cache_read_tokens=15)
-        elif name.startswith("gemini-3.1-pro"):
-            # Gemini 3.1 Pro: $2.00 input, $12.00 output per 1M tokens for prompts <= 200k tokens
-            return TokenUsage(input_tokens=200, output_tokens=1200, reasoning_tokens=0, cache_creation_tokens=250, cache_read_tokens=20)
-        elif name.startswith("gemini-3.1-flash-lite"):
-            # Gemini 3.1 Flash-Lite: $0.25 input, $1.50 output per 1M tokens
-            return TokenUsage(input_tokens=25, output_tokens=150, reasoning_tokens=0, cache_creation_tokens=31, cache_read_tokens=2)
-        elif name.startswith("gemini-3-pro"):
-            # Gemini 3 Pro: $1.25 input, $10.00 output per 1M tokens (deprecated on Google API March 9, 2026)
-            return TokenUsage(input_tokens=125, output_tokens=1000, reasoning_tokens=0, cache_creation_tokens=156, cache_read_tokens=12)
-        elif name.startswith("gemini-3-flash"):
-            # Gemini 3 Flash: $0.50 input, $3.00 output per 1M tokens
-            return TokenUsage(input_tokens=50, output_tokens=300, reasoning_tokens=0, cache_creation_tokens=62, cache_read_tokens=5)
 
-        # Default fallback for unknown models
-        else:
-            return TokenUsage(input_tokens=0, output_tokens=0, reasoning_tokens=0, cache_creation_tokens=0, cache_read_tokens=0)
+class BuiltinCostProvider(CostProvider):
+    def get_token_pricing(self, model: LLMModel) -> TokenUsage:
+        """Get token pricing in USD cents per million tokens."""
+        input_tokens, output_tokens, reasoning_tokens, cache_creation_tokens, cache_read_tokens = _pricing_for_name(model.name)
+        return TokenUsage(
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            reasoning_tokens=reasoning_tokens,
+            cache_creation_tokens=cache_creation_tokens,
+            cache_read_tokens=cache_read_tokens,
+        )
@@ -44,9 +44,9 @@ WHY WEB SERVERS CAN'T USE THE LOOP MANAGER:
 ===========================================
 Web servers MUST NOT use the external event loop approach because:
 
-1. **Streaming breaks**: When operations run in a separate thread's event loop,
-   you lose the ability to stream results back to the web server's event loop
-   in real-time. The thread boundary kills the streaming semantics.
+1. **Streaming crosses threads**: When operations run in a separate thread's event
+   loop, every streamed item has to be handed back to the web server's event loop
+   across the thread boundary.
 
 2. **Request context isolation**: Web frameworks expect all operations for a
    request to happen in the same event loop to maintain proper async context,
@@ -108,8 +108,10 @@ since it would require significant architectural changes on their end.
 """
 
 import asyncio
+import contextlib
+import inspect
 import threading
-import time
+import weakref
 from typing import Optional
 
 from spaik_sdk.models.llm_config import LLMConfig
@@ -118,6 +120,19 @@ from spaik_sdk.utils.init_logger import init_logger
 
 logger = init_logger(__name__)
 
+# A loop once seen running under a web server keeps serving it, so positive detections are
+# remembered per loop and the stack walk is skipped on later requests.
+_web_server_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
+# Items buffered between the langchain loop and a consumer on another loop
+STREAM_QUEUE_SIZE = 32
+
+# Wakes a stream consumer waiting on an empty queue once the producer has stopped
+_WAKE_UP = object()
+
+_WEB_SERVER_THREAD_NAMES = ("uvicorn", "fastapi", "starlette", "asgi", "wsgi")
+_WEB_FRAMEWORK_INDICATORS = (*_WEB_SERVER_THREAD_NAMES, "tornado", "aiohttp", "sanic", "quart")
+
 
 class LangChainLoopManager:
     """Manages a persistent event loop for langchain operations"""
@@ -129,71 +144,97 @@ class LangChainLoopManager:
 
     def get_loop(self) -> asyncio.AbstractEventLoop:
         """Get or create the persistent event loop for langchain operations"""
+        # Lock-free fast path once the loop is running; the lock only guards creating it
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            return loop
+
         with self._lock:
             if self._loop is None or self._loop.is_closed():
-                self._loop = None
+                # Create the loop here and hand it to the thread, so it is usable immediately:
+                # work scheduled with run_coroutine_threadsafe waits until run_forever starts
+                new_loop = asyncio.new_event_loop()
 
                 def run_loop():
-                    self._loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(self._loop)
-                    self._loop.run_forever()
+                    asyncio.set_event_loop(new_loop)
+                    new_loop.run_forever()
 
+                self._loop = new_loop
                 self._loop_thread = threading.Thread(target=run_loop, daemon=True)
                 self._loop_thread.start()
 
-                # Wait for loop to be created
-                while self._loop is None:
-                    time.sleep(0.01)
-
             return self._loop
 
     async def run_in_loop(self, coro):
         """Run a coroutine in the langchain loop and return the result"""
         loop = self.get_loop()
+        if asyncio.get_running_loop() is loop:
+            # We're already in the langchain loop, run directly
+            return await coro
 
-        try:
-            current_loop = asyncio.get_running_loop()
-            if current_loop != loop:
-                # We're in a different loop context, run in langchain loop
-                future = asyncio.run_coroutine_threadsafe(coro, loop)
-                return future.result()
-            else:
-                # We're already in the langchain loop, run directly
-                return await coro
-        except RuntimeError:
-            # No running loop, run in langchain loop
-            future = asyncio.run_coroutine_threadsafe(coro, loop)
-            return future.result()
+        # Await the result without blocking the caller's loop while the langchain loop works
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
 
     async def stream_in_loop(self, async_generator):
         """Stream results from an async generator running in the langchain loop"""
         loop = self.get_loop()
-
-        try:
-            current_loop = asyncio.get_running_loop()
-            if current_loop != loop:
-                # We're in a different loop context, collect all results first
-                future = asyncio.run_coroutine_threadsafe(self._collect_from_async_generator(async_generator), loop)
-                results = future.result()
-                for result in results:
-                    yield result
-            else:
-                # We're already in the langchain loop, stream directly
-                async for result in async_generator:
-                    yield result
-        except RuntimeError:
-            # No running loop, collect all results first
-            future = asyncio.run_coroutine_threadsafe(self._collect_from_async_generator(async_generator), loop)
-            results = future.result()
-            for result in results:
+        current_loop = asyncio.get_running_loop()
+        if current_loop is loop:
+            # We're already in the langchain loop, stream directly
+            async for result in async_generator:
                 yield result
-
-    async def _collect_from_async_generator(self, async_generator):
-        """Collect all items from an async generator"""
-        results = []
-        async for item in async_generator:
-            results.append(item)
-        return results
+            return
+
+        # Items are handed over to the caller's loop as they are produced, so the caller sees
+        # them in real time instead of after the whole generator has finished
+        queue: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        # Set once the producer stops, however it stops; holds the error it stopped with, if any
+        outcome: asyncio.Future = current_loop.create_future()
+
+        async def hand_over(item) -> None:
+            # Waits while the queue is full, so a slow consumer holds the producer back
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(queue.put(item), current_loop))
+
+        def finish(error: Optional[BaseException]) -> None:
+            # Runs in the caller's loop and never blocks: the outcome is read once the queue is drained,
+            # and a wake-up is only needed if the consumer may be waiting on an empty queue
+            if not outcome.done():
+                outcome.set_result(error)
+            if not queue.full():
+                queue.put_nowait(_WAKE_UP)
+
+        async def produce():
+            error: Optional[BaseException] = None
+            try:
+                try:
+                    async for item in async_generator:
+                        await hand_over(item)
+                finally:
+                    # Close it here, in its own loop, rather than whenever the garbage collector gets to it
+                    await async_generator.aclose()
+            except BaseException as e:
+                error = e
+                if not isinstance(e, Exception):
+                    # Cancellation and the like still end the task; finish() tells the consumer either way
+                    raise
+            finally:
+                with contextlib.suppress(RuntimeError):  # The caller's loop is already closed
+                    current_loop.call_soon_threadsafe(finish, error)
+
+        future = asyncio.run_coroutine_threadsafe(produce(), loop)
+        try:
+            while True:
+                if queue.empty() and outcome.done():
+                    error = outcome.result()
+                    if error is not None:
+                        raise error
+                    return
+                item = await queue.get()
+                if item is not _WAKE_UP:
+                    yield item
+        finally:
+            # Stops the producer (and closes the generator in its own loop) if the caller quits early
+            future.cancel()
 
 
 def _is_in_web_server_context() -> bool:
@@ -201,49 +242,52 @@ def _is_in_web_server_context() -> bool:
     try:
         # Check if we're in an event loop
         loop = asyncio.get_running_loop()
-
-        # FastAPI/web servers typically run event loops indefinitely
-        # Check for common web server indicators in the call stack
-        import inspect
-        import threading
-
-        # Get current thread name - web servers often have descriptive thread names
-        thread_name = threading.current_thread().name
-        if any(name in thread_name.lower() for name in ["uvicorn", "fastapi", "starlette", "asgi", "wsgi"]):
-            return True
-
-        # Check the call stack for web framework indicators
-        frame = inspect.currentframe()
-        try:
-            while frame:
-                frame_info = inspect.getframeinfo(frame)
-                filename = frame_info.filename.lower()
-
-                # Look for web framework files in the call stack
-                if any(
-                    indicator in filename
-                    for indicator in ["uvicorn", "fastapi", "starlette", "asgi", "wsgi", "tornado", "aiohttp", "sanic", "quart"]
-                ):
-                    return True
-
-                frame = frame.f_back
-        finally:
-            del frame
-
-        # Check if the event loop has been running for a while (web servers)
-        # vs just started (asyncio.run())
-        if hasattr(loop, "_ready") and hasattr(loop._ready, "__len__") and len(loop._ready) > 0:  # type: ignore[arg-type]
-            # This is a heuristic - web servers tend to have more pending tasks
-            return True
-
-        return False
-
     except RuntimeError:
         # No running event loop - definitely not in a web server
         return False
+
+    if loop in _web_server_loops:
+        return True
+    try:
+        in_web_server = _detect_web_server_context(loop)
     except Exception as e:
         logger.debug(f"Error detecting web server context: {e}")
         return False
+    if in_web_server:
+        _web_server_loops.add(loop)
+    return in_web_server
+
+
+def _detect_web_server_context(loop: asyncio.AbstractEventLoop) -> bool:
+    # FastAPI/web servers typically run event loops indefinitely
+    # Check for common web server indicators in the call stack
+    # Get current thread name - web servers often have descriptive thread names
+    thread_name = threading.current_thread().name.lower()
+    if any(name in thread_name for name in _WEB_SERVER_THREAD_NAMES):
+        return True
+
+    # Check the call stack for web framework indicators
+    frame = inspect.currentframe()
+    try:
+        while frame:
+            # co_filename is all we need; inspect.getframeinfo would also read source lines from disk
+            filename = frame.f_code.co_filename.lower()
+
+            # Look for web framework files in the call stack
+            if any(indicator in filename for indicator in _WEB_FRAMEWORK_INDICATORS):
+                return True
+
+            frame = frame.f_back
+    finally:
+        del frame
+
+    # Check if the event loop has been running for a while (web servers)
+    # vs just started (asyncio.run())
+    if hasattr(loop, "_ready") and hasattr(loop._ready, "__len__") and len(loop._ready) > 0:  # type: ignore[arg-type]
+        # This is a heuristic - web servers tend to have more pending tasks
+        return True
+
+    return False
 
 
 def _needs_loop_manager(llm_config: LLMConfig) -> bool:
@@ -2,16 +2,10 @@ import json
 import logging
 import time
 import uuid
-from typing import Dict, List, Optional, Type, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, TypeVar, cast
 
 from langchain_core.runnables import RunnableConfig
 from langchain_core.tools import BaseTool
-
-# Using create_react_agent because create_agent from langchain.agents
-# uses invoke() internally and does NOT emit on_chat_model_stream events,
-# which breaks token-level streaming. See: https://github.com/langchain-ai/langchain/issues/34017
-from langgraph.graph.state import CompiledStateGraph
-from langgraph.prebuilt import ToolNode, create_react_agent  # type: ignore[deprecated]
 from pydantic import BaseModel
 
 from spaik_sdk.attachments.file_storage_provider import get_file_storage
@@ -21,7 +15,9 @@ from spaik_sdk.llm.cancellation_handle import CancellationHandle
 from spaik_sdk.llm.extract_error_message import extract_error_message
 from spaik_sdk.llm.langchain_loop_manager import get_langchain_loop_manager, should_use_loop_manager
 from spaik_sdk.llm.message_handler import MessageHandler
+from spaik_sdk.llm.response_cache import ResponseCache
 from spaik_sdk.models.llm_config import LLMConfig
+from spaik_sdk.models.providers.provider_type import ProviderType
 from spaik_sdk.recording.base_playback import BasePlayback
 from spaik_sdk.recording.base_recorder import BaseRecorder
 from spaik_sdk.thread.models import ErrorEvent, MessageBlock, MessageBlockType, ThreadMessage
@@ -29,6 +25,9 @@ from spaik_sdk.thread.thread_container import ThreadContainer
 from spaik_sdk.tools.tool_provider import ToolProvider
 from spaik_sdk.utils.init_logger import init_logger
 
+if TYPE_CHECKING:
+    from langgraph.graph.state import CompiledStateGraph
+
 DEBUG = env_config.is_debug_mode("langchain")
 logger = init_logger(__name__)
 
@@ -56,6 +55,7 @@ class LangChainService:
         recorder: Optional[BaseRecorder] = None,
         playback: Optional[BasePlayback] = None,
         cancellation_handle: Optional[CancellationHandle] = None,
+        response_cache: Optional[ResponseCache] = None,
     ):
         self.llm_config = llm_config
 
@@ -73,8 +73,15 @@ class LangChainService:
         self.recorder = recorder
         self.playback = playback
         self.cancellation_handle = cancellation_handle
+        self.response_cache = response_cache
+
+    def create_executor(self, tools: list[BaseTool]) -> "CompiledStateGraph":
+        # Imported here: langgraph is slow to import and only needed once an executor is built.
+        # Using create_react_agent because create_agent from langchain.agents
+        # uses invoke() internally and does NOT emit on_chat_model_stream events,
+        # which breaks token-level streaming. See: https://github.com/langchain-ai/langchain/issues/34017
+        from langgraph.prebuilt import ToolNode, create_react_agent  # type: ignore[deprecated]
 
-    def create_executor(self, tools: list[BaseTool]) -> CompiledStateGraph:
         # handle_tool_errors=True: the LangGraph default re-raises non-validation
         # tool exceptions, which kills the agent loop silently. See issue #61.
         tool_node = ToolNode(tools, handle_tool_errors=True)
@@ -83,6 +90,13 @@ class LangChainService:
     def _get_model(self):
         return self.llm_config.get_model_wrapper().get_langchain_model()
 
+    def _get_system_prompt_cache_control(self) -> Optional[Dict[str, Any]]:
+        # Only the direct Anthropic API accepts explicit cache_control markers on message blocks;
+        # other providers either cache prefixes automatically or reject unknown block keys.
+        if self.llm_config.provider_type != ProviderType.ANTHROPIC:
+            return None
+        return self.llm_config.get_model_wrapper().get_cache_control()
+
     def _build_tool_providers_by_tool_name(self, tools: List[BaseTool]) -> Dict[str, ToolProvider]:
         providers_by_tool_name: Dict[str, ToolProvider] = {}
         for tool in tools:
@@ -97,41 +111,103 @@ class LangChainService:
     def get_structured_response(self, input: str, output_schema: Type[T]) -> T:
         # Handle playback mode
         if self.playback is not None:
-            ret = output_schema.model_validate(next(self.playback))
-            self._on_request_completed()
-            return ret
+            return self._play_back_structured_response(output_schema)
+
+        ret, cache_key = self._start_structured_response(input, output_schema)
+        if ret is None:
+            model_with_tools = self._get_model().with_structured_output(output_schema)
+            ret = cast(T, model_with_tools.invoke(input))
+        return self._complete_structured_response(ret, cache_key)
+
+    async def get_structured_response_async(self, input: str, output_schema: Type[T]) -> T:
+        """Same as get_structured_response, but awaits the model instead of blocking the event loop."""
+        if self.playback is not None:
+            return self._play_back_structured_response(output_schema)
+
+        ret, cache_key = self._start_structured_response(input, output_schema)
+        if ret is None:
+            model_with_tools = self._get_model().with_structured_output(output_schema)
+            if should_use_loop_manager(self.llm_config):
+                ret = cast(T, await get_langchain_loop_manager().run_in_loop(model_with_tools.ainvoke(input)))
+            else:
+                ret = cast(T, await model_with_tools.ainvoke(input))
+        return self._complete_structured_response(ret, cache_key)
+
+    def _play_back_structured_response(self, output_schema: Type[T]) -> T:
+        assert self.playback is not None
+        ret = output_schema.model_validate(next(self.playback))
+        self._on_request_completed()
+        return ret
 
+    def _start_structured_response(self, input: str, output_schema: Type[T]) -> Tuple[Optional[T], Optional[str]]:
+        """Add the prompt to the thread and look it up in the response cache.
+
+        Returns the cached response, or None and the key to cache the model's response under (None when caching is off).
+        """
         self.thread_container.add_message(
             ThreadMessage(
                 id=str(uuid.uuid4()),
                 ai=False,
                 author_id="structured_response  ",
                 author_name="structured_response",
-                timestamp=int(time.time() * 1000),
+                timestamp=time.time_ns() // 1_000_000,
                 blocks=[MessageBlock(id=str(uuid.uuid4()), streaming=False, type=MessageBlockType.PLAIN, content=input)],
             )
         )
-        model_with_tools = self._get_model().with_structured_output(output_schema)
-        ret = cast(T, model_with_tools.invoke(input))
+        # Recording mode must always hit the model so the recording stays complete
+        if self.response_cache is None or self.recorder is not None:
+            return None, None
+        cache_key = self._get_structured_response_cache_key(input, output_schema)
+        cached = self.response_cache.get(cache_key)
+        if cached is not None:
+            return output_schema.model_validate(cached), None
+        return None, cache_key
+
+    def _complete_structured_response(self, ret: T, cache_key: Optional[str]) -> T:
+        # Dump once; the cache, the recorder and the thread all take the same dict
+        dumped = ret.model_dump()
+        if cache_key is not None and self.response_cache is not None:
+            self.response_cache.put(cache_key, dumped)
 
         # Record structured response if recorder is present
         if self.recorder is not None:
-            self.recorder.record_structured(ret.model_dump())
+            self.recorder.record_structured(dumped)
 
-        as_json_block = "```json\n" + json.dumps(ret.model_dump()) + "\n```"
+        as_json_block = f"```json\n{json.dumps(dumped)}\n```"
         self.thread_container.add_message(
             ThreadMessage(
                 id=str(uuid.uuid4()),
                 ai=True,
                 author_id=self.message_handler.assistant_id,
                 author_name=self.message_handler.assistant_name,
-                timestamp=int(time.time() * 1000),
+                timestamp=time.time_ns() // 1_000_000,
                 blocks=[MessageBlock(id=str(uuid.uuid4()), streaming=False, type=MessageBlockType.PLAIN, content=as_json_block)],
             )
         )
         self._on_request_completed()
         return ret
 
+    def _get_structured_response_cache_key(self, input: str, output_schema: Type[BaseModel]) -> str:
+        # Key on the schema itself rather than its name, which dynamically created or redefined models can share,
+        # and on every setting that changes what the model answers
+        config = self.llm_config
+        settings = {
+            "provider_type": config.provider_type,
+            "provider": type(config.provider).__name__ if config.provider is not None else None,
+            "reasoning": config.reasoning,
+            "reasoning_effort": config.reasoning_effort,
+            "reasoning_summary": config.reasoning_summary,
+            "reasoning_budget_tokens": config.reasoning_budget_tokens,
+            "max_output_tokens": config.max_output_tokens,
+            "temperature": config.temperature,
+        }
+        return ResponseCache.make_key(
+            config.model.name,
+            json.dumps(settings, sort_keys=True, default=str),
+            json.dumps(output_schema.model_json_schema(), sort_keys=True),
+            input,
+        )
+
     async def execute_stream_tokens(
         self,
         user_input: Optional[str] = None,
@@ -189,11 +265,12 @@ class LangChainService:
 
         # Get messages - use multimodal converter if file_storage is available
         file_storage = get_file_storage()
+        cache_control = self._get_system_prompt_cache_control()
         if file_storage is not None:
             provider_family = self.llm_config.model.family
-            messages = await self.thread_container.get_langchain_messages_multimodal(file_storage, provider_family)
+            messages = await self.thread_container.get_langchain_messages_multimodal(file_storage, provider_family, cache_control)
         else:
-            messages = self.thread_container.get_langchain_messages()
+            messages = self.thread_container.get_langchain_messages(cache_control)
 
         # Use astream_events to get individual token events
         config = RunnableConfig(recursion_limit=self.llm_config.max_agent_steps)
@@ -3,7 +3,8 @@ import uuid
 from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Dict, List, Optional
 
 from spaik_sdk.attachments.models import Attachment
-from spaik_sdk.llm.streaming.streaming_event_handler import EventType, StreamingEventHandler
+from spaik_sdk.llm.streaming.models import EventType, StreamingEvent
+from spaik_sdk.llm.streaming.streaming_event_handler import StreamingEventHandler
 from spaik_sdk.recording.base_recorder import BaseRecorder
 from spaik_sdk.thread.models import MessageBlock, MessageBlockType, ThreadMessage
 from spaik_sdk.thread.thread_container import ThreadContainer
@@ -14,6 +15,9 @@ if TYPE_CHECKING:
 
 logger = init_logger(__name__)
 
+# Enum .value is a property lookup; content events are handled once per token, so resolve it up front
+_EVENT_TYPE_VALUES: Dict[EventType, str] = {event_type: event_type.value for event_type in EventType}
+
 
 class MessageHandler:
     """Manages conversation message history using ThreadContainer."""
@@ -31,6 +35,19 @@ class MessageHandler:
         self.assistant_name = assistant_name
         self.assistant_id = assistant_id
         self.tool_provider_resolver = tool_provider_resolver
+        # One handler per event type; event types without a handler are ignored
+        self._event_handlers: Dict[EventType, Callable[[StreamingEvent], Optional[Dict[str, Any]]]] = {
+            EventType.TOKEN: self._on_content,
+            EventType.REASONING: self._on_content,
+            EventType.REASONING_SUMMARY: self._on_content,
+            EventType.MESSAGE_START: self._on_message_start,
+            EventType.BLOCK_START: self._on_block_start,
+            EventType.BLOCK_END: self._on_block_end,
+            EventType.USAGE_METADATA: self._on_usage_metadata,
+            EventType.COMPLETE: self._on_complete,
+            EventType.TOOL_USE: self._on_tool_use,
+            EventType.TOOL_RESPONSE: self._on_tool_response,
+        }
         self._update_previous_message_count()
 
     def _update_previous_message_count(self) -> None:
@@ -52,7 +69,7 @@ class MessageHandler:
             ai=False,
             author_id=author_id,
             author_name=author_name,
-            timestamp=int(time.time() * 1000),
+            timestamp=time.time_ns() // 1_000_000,
             blocks=[
                 MessageBlock(
                     id=block_id,
@@ -81,134 +98,146 @@ class MessageHandler:
         agent_stream,
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Process agent event stream for individual tokens and yield them in real-time."""
+        dispatch = self._event_handlers
         async for streaming_event in self.streaming_handler.process_stream(agent_stream):
-            if streaming_event.event_type == EventType.MESSAGE_START:
-                logger.debug(f"🔍 Processing MESSAGE_START for message: {streaming_event.message_id}")
-                # Create AI message in thread container
-                assert streaming_event.message_id is not None
-                ai_message = ThreadMessage(
-                    id=streaming_event.message_id,
-                    ai=True,
-                    author_id=self.assistant_id,
-                    author_name=self.assistant_name,
-                    timestamp=int(time.time() * 1000),
-                    blocks=[],
-                )
-                self.thread_container.add_message(ai_message)
-
-            elif streaming_event.event_type == EventType.BLOCK_START:
-                # Add new block to the message
-                assert streaming_event.block_id is not None
-                assert streaming_event.block_type is not None
-                assert streaming_event.message_id is not None
-                tool_provider = self._resolve_tool_provider(streaming_event.tool_name)
-                new_block = MessageBlock(
-                    id=streaming_event.block_id,
-                    streaming=True,
-                    type=streaming_event.block_type,
-                    tool_provider_id=tool_provider.get_provider_id() if tool_provider is not None else None,
-                    tool_provider=tool_provider,
-                    tool_call_id=streaming_event.tool_call_id,
-                    tool_call_args=streaming_event.tool_args,
-                    tool_name=streaming_event.tool_name,
-                )
-                self.thread_container.add_message_block(streaming_event.message_id, new_block)
-
-            elif streaming_event.event_type == EventType.BLOCK_END:
-                logger.debug(f"🔚 Processing BLOCK_END for block: {streaming_event.block_id}")
-                # Mark individual block as non-streaming (completed)
-                assert streaming_event.block_id is not None
-                assert streaming_event.message_id is not None
-                logger.debug(f"🔚 Processing BLOCK_END for block: {streaming_event.block_id}")
-                self.thread_container.finalize_streaming_blocks(streaming_event.message_id, [streaming_event.block_id])
-                logger.debug(f"✅ Block {streaming_event.block_id} marked as completed")
-
-            elif streaming_event.event_type in [EventType.REASONING, EventType.REASONING_SUMMARY, EventType.TOKEN]:
-                logger.debug(f"🔍 Processing {streaming_event.event_type.value} for block: {streaming_event.block_id}")
-                # Add streaming content
-                assert streaming_event.block_id is not None
-                assert streaming_event.content is not None
-                self.thread_container.add_streaming_message_chunk(streaming_event.block_id, streaming_event.content)
-
-                # Yield for external consumption
-                yield {
-                    "type": streaming_event.event_type.value,
-                    "content": streaming_event.content,
-                    "block_id": streaming_event.block_id,
-                    "message_id": streaming_event.message_id,
-                }
-
-            elif streaming_event.event_type == EventType.USAGE_METADATA:
-                logger.debug(f"Processing USAGE_METADATA for message: {streaming_event.message_id}")
-                # Store consumption metadata in ThreadContainer
-                if streaming_event.message_id and streaming_event.usage_metadata:
-                    self.thread_container.add_consumption_metadata(streaming_event.message_id, streaming_event.usage_metadata)
-                # Yield usage metadata for external consumption
-                yield {
-                    "type": "usage_metadata",
-                    "message_id": streaming_event.message_id,
-                    "usage_metadata": streaming_event.usage_metadata,
-                }
-
-            elif streaming_event.event_type == EventType.COMPLETE:
-                logger.debug(f"🔍 Processing COMPLETE for message: {streaming_event.message_id}")
-                # Mark all blocks as non-streaming
-                if streaming_event.message_id and streaming_event.blocks:
-                    self.thread_container.finalize_streaming_blocks(streaming_event.message_id, streaming_event.blocks)
-
-                yield {
-                    "type": "complete",
-                    "message": streaming_event.message,
-                    "blocks": streaming_event.blocks,
-                    "message_id": streaming_event.message_id,
-                }
-
-            elif streaming_event.event_type == EventType.TOOL_USE:
-                logger.debug(f"🔍 Processing TOOL_USE for block: {streaming_event.block_id}")
-                assert streaming_event.block_id is not None
-                assert streaming_event.message_id is not None
-                tool_provider = self._resolve_tool_provider(streaming_event.tool_name)
-                self.thread_container.add_message_block(
-                    streaming_event.message_id,
-                    MessageBlock(
-                        id=streaming_event.block_id,
-                        streaming=True,
-                        type=MessageBlockType.TOOL_USE,
-                        tool_provider_id=tool_provider.get_provider_id() if tool_provider is not None else None,
-                        tool_provider=tool_provider,
-                        tool_call_id=streaming_event.tool_call_id,
-                        tool_call_args=streaming_event.tool_args,
-                        tool_name=streaming_event.tool_name,
-                    ),
-                )
+            handler = dispatch.get(streaming_event.event_type)
+            if handler is None:
+                continue
+            output = handler(streaming_event)
+            if output is not None:
+                yield output
+
+    def _on_content(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        # Runs once per streamed token, so each field is read only once
+        event_type, block_id, content = _EVENT_TYPE_VALUES[streaming_event.event_type], streaming_event.block_id, streaming_event.content
+        logger.debug("🔍 Processing %s for block: %s", event_type, block_id)
+        # Add streaming content
+        assert block_id is not None
+        assert content is not None
+        self.thread_container.add_streaming_message_chunk(block_id, content)
+
+        # Yield for external consumption
+        return {
+            "type": event_type,
+            "content": content,
+            "block_id": block_id,
+            "message_id": streaming_event.message_id,
+        }
+
+    def _on_message_start(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        logger.debug("🔍 Processing MESSAGE_START for message: %s", streaming_event.message_id)
+        # Create AI message in thread container
+        assert streaming_event.message_id is not None
+        ai_message = ThreadMessage(
+            id=streaming_event.message_id,
+            ai=True,
+            author_id=self.assistant_id,
+            author_name=self.assistant_name,
+            timestamp=time.time_ns() // 1_000_000,
+            blocks=[],
+        )
+        self.thread_container.add_message(ai_message)
+        return None
+
+    def _on_block_start(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        # Add new block to the message
+        assert streaming_event.block_id is not None
+        assert streaming_event.block_type is not None
+        assert streaming_event.message_id is not None
+        tool_provider = self._resolve_tool_provider(streaming_event.tool_name)
+        new_block = MessageBlock(
+            id=streaming_event.block_id,
+            streaming=True,
+            type=streaming_event.block_type,
+            tool_provider_id=tool_provider.get_provider_id() if tool_provider is not None else None,
+            tool_provider=tool_provider,
+            tool_call_id=streaming_event.tool_call_id,
+            tool_call_args=streaming_event.tool_args,
+            tool_name=streaming_event.tool_name,
+        )
+        self.thread_container.add_message_block(streaming_event.message_id, new_block)
+        return None
+
+    def _on_block_end(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        logger.debug("🔚 Processing BLOCK_END for block: %s", streaming_event.block_id)
+        # Mark individual block as non-streaming (completed)
+        assert streaming_event.block_id is not None
+        assert streaming_event.message_id is not None
+        self.thread_container.finalize_streaming_blocks(streaming_event.message_id, [streaming_event.block_id])
+        logger.debug("✅ Block %s marked as completed", streaming_event.block_id)
+        return None
+
+    def _on_usage_metadata(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        logger.debug("Processing USAGE_METADATA for message: %s", streaming_event.message_id)
+        # Store consumption metadata in ThreadContainer
+        if streaming_event.message_id and streaming_event.usage_metadata:
+            self.thread_container.add_consumption_metadata(streaming_event.message_id, streaming_event.usage_metadata)
+        # Yield usage metadata for external consumption
+        return {
+            "type": "usage_metadata",
+            "message_id": streaming_event.message_id,
+            "usage_metadata": streaming_event.usage_metadata,
+        }
+
+    def _on_complete(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        logger.debug("🔍 Processing COMPLETE for message: %s", streaming_event.message_id)
+        # Mark all blocks as non-streaming
+        if streaming_event.message_id and streaming_event.blocks:
+            self.thread_container.finalize_streaming_blocks(streaming_event.message_id, streaming_event.blocks)
+
+        return {
+            "type": "complete",
+            "message": streaming_event.message,
+            "blocks": streaming_event.blocks,
+            "message_id": streaming_event.message_id,
+        }
+
+    def _on_tool_use(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        logger.debug("🔍 Processing TOOL_USE for block: %s", streaming_event.block_id)
+        assert streaming_event.block_id is not None
+        assert streaming_event.message_id is not None
+        tool_provider = self._resolve_tool_provider(streaming_event.tool_name)
+        self.thread_container.add_message_block(
+            streaming_event.message_id,
+            MessageBlock(
+                id=streaming_event.block_id,
+                streaming=True,
+                type=MessageBlockType.TOOL_USE,
+                tool_provider_id=tool_provider.get_provider_id() if tool_provider is not None else None,
+                tool_provider=tool_provider,
+                tool_call_id=streaming_event.tool_call_id,
+                tool_call_args=streaming_event.tool_args,
+                tool_name=streaming_event.tool_name,
+            ),
+        )
 
-                yield {
-                    "type": "tool_use",
-                    "tool_call_id": streaming_event.tool_call_id,
-                    "tool_name": streaming_event.tool_name,
-                    "tool_args": streaming_event.tool_args,
-                    "block_id": streaming_event.block_id,
-                    "message_id": streaming_event.message_id,
-                }
-
-            elif streaming_event.event_type == EventType.TOOL_RESPONSE:
-                logger.debug(f"🔍 Processing TOOL_RESPONSE for block: {streaming_event.block_id}")
-                # Handle tool response - update the thread container with the response
-                assert streaming_event.tool_call_id is not None
-                assert streaming_event.content is not None
-                self.thread_container.update_tool_use_block_with_response(
-                    streaming_event.tool_call_id, streaming_event.content, streaming_event.error
-                )
+        return {
+            "type": "tool_use",
+            "tool_call_id": streaming_event.tool_call_id,
+            "tool_name": streaming_event.tool_name,
+            "tool_args": streaming_event.tool_args,
+            "block_id": streaming_event.block_id,
+            "message_id": streaming_event.message_id,
+        }
+
+    def _on_tool_response(self, streaming_event: StreamingEvent) -> Optional[Dict[str, Any]]:
+        logger.debug("🔍 Processing TOOL_RESPONSE for block: %s", streaming_event.block_id)
+        # Handle tool response - update the thread container with the response
+        assert streaming_event.tool_call_id is not None
+        assert streaming_event.content is not None
+        self.thread_container.update_tool_use_block_with_response(
+            streaming_event.tool_call_id, streaming_event.content, streaming_event.error
+        )
 
-                # Yield for external consumption
-                yield {
-                    "type": "tool_response",
-                    "tool_call_id": streaming_event.tool_call_id,
-                    "response": streaming_event.content,
-                    "error": streaming_event.error,
-                    "block_id": streaming_event.block_id,
-                    "message_id": streaming_event.message_id,
-                }
+        # Yield for external consumption
+        return {
+            "type": "tool_response",
+            "tool_call_id": streaming_event.tool_call_id,
+            "response": streaming_event.content,
+            "error": streaming_event.error,
+            "block_id": streaming_event.block_id,
+            "message_id": streaming_event.message_id,
+        }
 
     def _resolve_tool_provider(self, tool_name: Optional[str]) -> Optional["ToolProvider"]:
         if tool_name is None or self.tool_provider_resolver is None:
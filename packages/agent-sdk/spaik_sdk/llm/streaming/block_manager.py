@@ -1,6 +1,6 @@
 import time
 import uuid
-from typing import Any, AsyncGenerator, Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from spaik_sdk.llm.streaming.models import EventType, StreamingEvent
 from spaik_sdk.thread.models import MessageBlockType
@@ -11,22 +11,24 @@ class BlockManager:
 
     def __init__(self):
         self.current_blocks: Dict[str, str] = {}  # block_id -> block_type
-        self.block_timestamps: Dict[str, float] = {}  # block_id -> creation_timestamp
         self.reasoning_block_id: Optional[str] = None
+        self.reasoning_block_timestamp: int = 0  # monotonic creation time, in ns, of the current reasoning block
         self.regular_block_id: Optional[str] = None
         self.summary_block_id: Optional[str] = None
         self.tool_use_blocks: Dict[str, str] = {}  # tool_call_id -> block_id
+        self.latest_tool_block_timestamp: int = 0  # monotonic creation time, in ns, of the newest tool block
         self.reasoning_detected = False
         self.last_block_type: Optional[str] = None  # Track the last type of block created
 
     def reset(self):
         """Reset block manager state."""
         self.current_blocks = {}
-        self.block_timestamps = {}
         self.reasoning_block_id = None
+        self.reasoning_block_timestamp = 0
         self.regular_block_id = None
         self.summary_block_id = None
         self.tool_use_blocks = {}
+        self.latest_tool_block_timestamp = 0
         self.reasoning_detected = False
         self.last_block_type = None
 
@@ -39,8 +41,8 @@ class BlockManager:
         if self.reasoning_block_id:
             # Remove the current reasoning block from tracking
             self.current_blocks.pop(self.reasoning_block_id, None)
-            self.block_timestamps.pop(self.reasoning_block_id, None)  # Remove timestamp too
         self.reasoning_block_id = None
+        self.reasoning_block_timestamp = 0
 
     def get_block_ids(self) -> List[str]:
         """Get list of all current block IDs."""
@@ -55,86 +57,87 @@ class BlockManager:
         if self.reasoning_block_id is None:
             return False
 
-        current_reasoning_timestamp = self.block_timestamps.get(self.reasoning_block_id, 0)
-
         # Check if any tool block is newer than our current reasoning block
-        for tool_block_id in self.tool_use_blocks.values():
-            tool_timestamp = self.block_timestamps.get(tool_block_id, 0)
-            if tool_timestamp > current_reasoning_timestamp:
-                return True
-
-        return False
+        return self.latest_tool_block_timestamp > self.reasoning_block_timestamp
 
-    async def ensure_tool_use_block(
+    def ensure_tool_use_block(
         self, message_id: str, tool_call_id: str, tool_name: str, tool_args: Dict[str, Any]
-    ) -> AsyncGenerator[StreamingEvent, None]:
-        """Ensure tool use block exists for the given tool call, create if needed."""
-        if tool_call_id not in self.tool_use_blocks:
-            block_id = f"tool_{uuid.uuid4()}"
-            self.tool_use_blocks[tool_call_id] = block_id
-            self.current_blocks[block_id] = "tool_use"
-            self.block_timestamps[block_id] = time.time()
-            self.last_block_type = "tool_use"  # Track that we created a tool block
-
-            yield StreamingEvent(
-                event_type=EventType.BLOCK_START,
-                block_id=block_id,
-                block_type=MessageBlockType.TOOL_USE,
-                message_id=message_id,
-                tool_call_id=tool_call_id,
-                tool_name=tool_name,
-                tool_args=tool_args,
-            )
+    ) -> Optional[StreamingEvent]:
+        """Ensure tool use block exists for the given tool call, create if needed.
+
+        Returns the BLOCK_START event for a newly created block, None if the block already exists.
+        """
+        if tool_call_id in self.tool_use_blocks:
+            return None
+        block_id = f"tool_{uuid.uuid4()}"
+        self.tool_use_blocks[tool_call_id] = block_id
+        self.current_blocks[block_id] = "tool_use"
+        self.latest_tool_block_timestamp = time.monotonic_ns()
+        self.last_block_type = "tool_use"  # Track that we created a tool block
+
+        return StreamingEvent(
+            event_type=EventType.BLOCK_START,
+            block_id=block_id,
+            block_type=MessageBlockType.TOOL_USE,
+            message_id=message_id,
+            tool_call_id=tool_call_id,
+            tool_name=tool_name,
+            tool_args=tool_args,
+        )
 
     def get_tool_use_block_id(self, tool_call_id: str) -> Optional[str]:
         """Get the block ID for a specific tool call."""
         return self.tool_use_blocks.get(tool_call_id)
 
-    async def ensure_reasoning_block(self, message_id: str) -> AsyncGenerator[StreamingEvent, None]:
-        """Ensure reasoning block exists, create if needed."""
-        if self.reasoning_block_id is None:
-            self.reasoning_block_id = f"reasoning_{uuid.uuid4()}"
-            self.current_blocks[self.reasoning_block_id] = "reasoning"
-            self.block_timestamps[self.reasoning_block_id] = time.time()
-            self.last_block_type = "reasoning"  # Track that we created a reasoning block
-
-            yield StreamingEvent(
-                event_type=EventType.BLOCK_START,
-                block_id=self.reasoning_block_id,
-                block_type=MessageBlockType.REASONING,
-                message_id=message_id,
-            )
-
-    async def ensure_regular_block(self, message_id: str) -> AsyncGenerator[StreamingEvent, None]:
-        """Ensure regular content block exists, create if needed."""
+    def ensure_reasoning_block(self, message_id: str) -> Optional[StreamingEvent]:
+        """Ensure reasoning block exists, create if needed.
+
+        Returns the BLOCK_START event for a newly created block, None if the block already exists.
+        """
+        if self.reasoning_block_id is not None:
+            return None
+        self.reasoning_block_id = f"reasoning_{uuid.uuid4()}"
+        self.current_blocks[self.reasoning_block_id] = "reasoning"
+        self.reasoning_block_timestamp = time.monotonic_ns()
+        self.last_block_type = "reasoning"  # Track that we created a reasoning block
+
+        return StreamingEvent(
+            event_type=EventType.BLOCK_START,
+            block_id=self.reasoning_block_id,
+            block_type=MessageBlockType.REASONING,
+            message_id=message_id,
+        )
+
+    def ensure_regular_block(self, message_id: str) -> Optional[StreamingEvent]:
+        """Ensure regular content block exists, create if needed.
+
+        Returns the BLOCK_START event for a newly created block, None if the current block is reused.
+        """
         # Create a new regular block if:
         # 1. No regular block exists yet, OR
         # 2. The last block created was not a regular block (meaning there was an interruption)
         should_create_new_block = self.regular_block_id is None or self.last_block_type not in [None, "plain"]
 
-        if should_create_new_block:
-            self.regular_block_id = f"plain_{uuid.uuid4()}"
-            self.current_blocks[self.regular_block_id] = "plain"
-            self.block_timestamps[self.regular_block_id] = time.time()
-            self.last_block_type = "plain"  # Track that we created a regular block
+        if not should_create_new_block:
+            return None
+        self.regular_block_id = f"plain_{uuid.uuid4()}"
+        self.current_blocks[self.regular_block_id] = "plain"
+        self.last_block_type = "plain"  # Track that we created a regular block
+
+        return StreamingEvent(
+            event_type=EventType.BLOCK_START, block_id=self.regular_block_id, block_type=MessageBlockType.PLAIN, message_id=message_id
+        )
 
-            yield StreamingEvent(
-                event_type=EventType.BLOCK_START, block_id=self.regular_block_id, block_type=MessageBlockType.PLAIN, message_id=message_id
-            )
+    def ensure_summary_block(self, message_id: str) -> None:
+        """Ensure summary block exists, create if needed.
 
-    async def ensure_summary_block(self, message_id: str) -> AsyncGenerator[StreamingEvent, None]:
-        """Ensure summary block exists, create if needed."""
+        Summary blocks are handled differently and don't emit a BLOCK_START event.
+        """
         if self.summary_block_id is None:
             self.summary_block_id = f"summary_{uuid.uuid4()}"
             self.current_blocks[self.summary_block_id] = "summary"
-            self.block_timestamps[self.summary_block_id] = time.time()
             self.last_block_type = "summary"  # Track that we created a summary block
 
-        # Note: We don't yield BLOCK_START for summary blocks as they're handled differently
-        # This is an async generator so we need at least one yield or return to make it work
-        return
-        yield  # This line will never be reached but satisfies the type checker
-
     def get_reasoning_block_id(self) -> Optional[str]:
         """Get the reasoning block ID."""
         return self.reasoning_block_id
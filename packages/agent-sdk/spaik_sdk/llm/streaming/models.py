@@ -24,7 +24,7 @@ class EventType(str, Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class StreamingEvent:
     """Represents a processed streaming event."""
 
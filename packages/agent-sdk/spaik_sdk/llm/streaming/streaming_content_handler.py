@@ -18,8 +18,9 @@ class StreamingContentHandler:
 
     async def handle_reasoning_content(self, reasoning_content: str) -> AsyncGenerator[StreamingEvent, None]:
         """Handle reasoning content and yield events."""
-        async for event in self._ensure_streaming_started():
-            yield event
+        start_event = self._ensure_streaming_started()
+        if start_event is not None:
+            yield start_event
 
         # Type guard to ensure message_id is not None
         if self.state_manager.current_message_id is None:
@@ -34,8 +35,9 @@ class StreamingContentHandler:
         creating_new_block = self.block_manager.get_reasoning_block_id() is None
 
         # Ensure reasoning block exists
-        async for streaming_event in self.block_manager.ensure_reasoning_block(self.state_manager.current_message_id):
-            yield streaming_event
+        block_start_event = self.block_manager.ensure_reasoning_block(self.state_manager.current_message_id)
+        if block_start_event is not None:
+            yield block_start_event
 
         # Track that we've created a reasoning block
         if creating_new_block:
@@ -56,16 +58,18 @@ class StreamingContentHandler:
 
     async def handle_regular_content(self, regular_content: str) -> AsyncGenerator[StreamingEvent, None]:
         """Handle regular content and yield events."""
-        async for event in self._ensure_streaming_started():
-            yield event
+        start_event = self._ensure_streaming_started()
+        if start_event is not None:
+            yield start_event
 
         # Type guard to ensure message_id is not None
         if self.state_manager.current_message_id is None:
             return
 
         # Ensure regular block exists
-        async for streaming_event in self.block_manager.ensure_regular_block(self.state_manager.current_message_id):
-            yield streaming_event
+        block_start_event = self.block_manager.ensure_regular_block(self.state_manager.current_message_id)
+        if block_start_event is not None:
+            yield block_start_event
 
         yield StreamingEvent(
             event_type=EventType.TOKEN,
@@ -81,7 +85,7 @@ class StreamingContentHandler:
             # Emit BLOCK_END event for the current reasoning block
             current_reasoning_block_id = self.block_manager.get_reasoning_block_id()
             if current_reasoning_block_id and self.state_manager.current_message_id:
-                logger.debug(f"🔚 Emitting BLOCK_END for reasoning block: {current_reasoning_block_id}")
+                logger.debug("🔚 Emitting BLOCK_END for reasoning block: %s", current_reasoning_block_id)
                 yield StreamingEvent(
                     event_type=EventType.BLOCK_END, block_id=current_reasoning_block_id, message_id=self.state_manager.current_message_id
                 )
@@ -97,34 +101,40 @@ class StreamingContentHandler:
         if self.state_manager.in_thinking_session:
             current_reasoning_block_id = self.block_manager.get_reasoning_block_id()
             if current_reasoning_block_id and self.state_manager.current_message_id:
-                logger.debug(f"🔚 Stream ending - emitting BLOCK_END for final reasoning block: {current_reasoning_block_id}")
+                logger.debug("🔚 Stream ending - emitting BLOCK_END for final reasoning block: %s", current_reasoning_block_id)
                 yield StreamingEvent(
                     event_type=EventType.BLOCK_END, block_id=current_reasoning_block_id, message_id=self.state_manager.current_message_id
                 )
             self.state_manager.end_thinking_session()
 
-    async def _ensure_streaming_started(self) -> AsyncGenerator[StreamingEvent, None]:
-        """Ensure streaming has been initialized and yield MESSAGE_START if needed."""
-        if not self.state_manager.streaming_started:
-            self.state_manager.current_message_id = str(uuid.uuid4())
-            self.state_manager.streaming_started = True
+    def _ensure_streaming_started(self) -> Optional[StreamingEvent]:
+        """Ensure streaming has been initialized and return MESSAGE_START if it just was.
 
-            yield StreamingEvent(event_type=EventType.MESSAGE_START, message_id=self.state_manager.current_message_id)
+        Called for every content event, so it is a plain method rather than an async generator.
+        """
+        if self.state_manager.streaming_started:
+            return None
+        self.state_manager.current_message_id = str(uuid.uuid4())
+        self.state_manager.streaming_started = True
+
+        return StreamingEvent(event_type=EventType.MESSAGE_START, message_id=self.state_manager.current_message_id)
 
     async def handle_tool_use(self, tool_call_id: str, tool_name: str, tool_args: Dict[str, Any]) -> AsyncGenerator[StreamingEvent, None]:
         """Handle tool use and yield events."""
-        async for event in self._ensure_streaming_started():
-            yield event
+        start_event = self._ensure_streaming_started()
+        if start_event is not None:
+            yield start_event
 
         # Type guard to ensure message_id is not None
         if self.state_manager.current_message_id is None:
             return
 
         # Ensure tool use block exists
-        async for streaming_event in self.block_manager.ensure_tool_use_block(
+        block_start_event = self.block_manager.ensure_tool_use_block(
             self.state_manager.current_message_id, tool_call_id, tool_name, tool_args
-        ):
-            yield streaming_event
+        )
+        if block_start_event is not None:
+            yield block_start_event
 
         # Emit tool use event
         yield StreamingEvent(
@@ -48,8 +48,9 @@ class StreamingEventHandler:
                 self.recorder.record_token(event)
 
             event_type = event.get("event", "")
-            data = event.get("data", {})
-            logger.trace(f"Stream event: {event_type}")
+            # "or {}" only builds the fallback dict when it is needed, not on every event
+            data = event.get("data") or {}
+            logger.trace("Stream event: %s", event_type)
 
             # on_chat_model_stream - real-time token streaming (preferred)
             if event_type == "on_chat_model_stream":
@@ -62,7 +63,7 @@ class StreamingEventHandler:
             # on_chain_stream - complete messages (fallback if no chat_model_stream)
             elif event_type == "on_chain_stream":
                 if not self._got_chat_model_stream:
-                    ai_message = self._extract_ai_message(data.get("chunk", {}))
+                    ai_message = self._extract_ai_message(data.get("chunk") or {})
                     if ai_message and not self._is_duplicate(ai_message):
                         async for streaming_event in self._handle_ai_message(ai_message):
                             yield streaming_event
@@ -78,7 +79,7 @@ class StreamingEventHandler:
 
             # on_chain_end - final state
             elif event_type == "on_chain_end":
-                output = data.get("output", {})
+                output = data.get("output") or {}
                 if isinstance(output, dict) and "messages" in output:
                     for msg in output["messages"]:
                         if isinstance(msg, (AIMessage, AIMessageChunk)):
@@ -164,7 +165,11 @@ class StreamingEventHandler:
                 if isinstance(block, dict):
                     block_type = block.get("type")
                     if block_type == "text":
-                        async for event in self.content_handler.handle_regular_content(block.get("text", "")):
+                        # Empty text parts (e.g. a text block start) would only open an empty block
+                        text = block.get("text", "")
+                        if not text:
+                            continue
+                        async for event in self.content_handler.handle_regular_content(text):
                             yield event
                         self.state_manager.mark_text_content_received()
                     elif block_type in ("reasoning", "thinking", "reasoning_summary"):
@@ -176,7 +181,7 @@ class StreamingEventHandler:
                         yield event
                     self.state_manager.mark_text_content_received()
 
-        if hasattr(message, "tool_calls") and message.tool_calls:
+        if message.tool_calls:
             for tool_call in message.tool_calls:
                 tool_details = self._extract_tool_call(tool_call)
                 if tool_details is None:
@@ -224,9 +229,14 @@ class StreamingEventHandler:
         return final_tool_calls
 
     def _extract_tool_call(self, tool_call) -> Optional[tuple[str, str, dict]]:
-        tool_id = tool_call.get("id") if isinstance(tool_call, dict) else getattr(tool_call, "id", None)
-        tool_name = tool_call.get("name") if isinstance(tool_call, dict) else getattr(tool_call, "name", None)
-        tool_args = tool_call.get("args", {}) if isinstance(tool_call, dict) else getattr(tool_call, "args", {})
+        if isinstance(tool_call, dict):
+            tool_id = tool_call.get("id")
+            tool_name = tool_call.get("name")
+            tool_args = tool_call.get("args", {})
+        else:
+            tool_id = getattr(tool_call, "id", None)
+            tool_name = getattr(tool_call, "name", None)
+            tool_args = getattr(tool_call, "args", {})
         if not tool_id or not tool_name:
             return None
         return tool_id, tool_name, tool_args if isinstance(tool_args, dict) else {}
@@ -259,7 +269,7 @@ class StreamingEventHandler:
 
     async def _emit_usage_if_available(self, message: AIMessageType) -> AsyncGenerator[StreamingEvent, None]:
         """Emit usage metadata if available on message."""
-        if hasattr(message, "usage_metadata") and message.usage_metadata:
+        if message.usage_metadata:
             yield StreamingEvent(
                 event_type=EventType.USAGE_METADATA,
                 message_id=self.state_manager.current_message_id,
@@ -42,7 +42,7 @@ class StreamingStateManager:
     def increment_reasoning_blocks(self):
         """Increment the count of reasoning blocks created."""
         self.reasoning_blocks_created += 1
-        logger.debug(f"Created reasoning block #{self.reasoning_blocks_created}")
+        logger.debug("Created reasoning block #%s", self.reasoning_blocks_created)
 
     def should_create_new_thinking_session(self, reasoning_content: bool, current_block_type: str) -> bool:
         """Determine if we should create a new thinking session (mid-response thinking)."""
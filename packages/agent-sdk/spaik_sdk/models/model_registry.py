@@ -109,11 +109,14 @@ class ModelRegistry:
 
     # Registry for custom models
     _custom_models: Set[LLMModel] = set()
+    # Resolved from_name lookups; cleared whenever the set of models changes
+    _name_cache: Dict[str, LLMModel] = {}
 
     @classmethod
     def register_custom(cls, model: LLMModel) -> LLMModel:
         """Register a custom model."""
         cls._custom_models.add(model)
+        cls._name_cache.clear()
         return model
 
     @classmethod
@@ -140,7 +143,11 @@ class ModelRegistry:
     @classmethod
     def from_name(cls, name: str) -> LLMModel:
         """Find model by name with alias support."""
-        return _find_model_by_name(name, cls._get_aliases())
+        model = cls._name_cache.get(name)
+        if model is None:
+            model = _find_model_by_name(name, cls._get_aliases())
+            cls._name_cache[name] = model
+        return model
 
     @classmethod
     def _get_aliases(cls) -> Dict[str, LLMModel]:
@@ -1,5 +1,6 @@
 import re
 from enum import Enum
+from functools import lru_cache
 from typing import Dict, Type, TypeVar
 
 
@@ -17,7 +18,7 @@ class ProviderType(Enum):
 
     @classmethod
     def from_name(cls, name: str) -> "ProviderType":
-        return _find_enum_by_name(cls, name, PROVIDER_ALIASES)
+        return _provider_type_from_name(name)
 
     @classmethod
     def from_model_name(cls, model_name: str) -> "ProviderType":
@@ -108,3 +109,8 @@ def _find_enum_by_name(enum_cls: Type[T], name: str, aliases: Dict[str, T]) -> T
     else:
         match_names = [m.value for m in matches]
         raise ValueError(f"Ambiguous {enum_cls.__name__} name '{name}'. Could match: {', '.join(match_names)}")
+
+
+@lru_cache(maxsize=64)
+def _provider_type_from_name(name: str) -> ProviderType:
+    return _find_enum_by_name(ProviderType, name, PROVIDER_ALIASES)
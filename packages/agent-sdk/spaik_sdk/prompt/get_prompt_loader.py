@@ -1,13 +1,21 @@
-from typing import Optional
+from typing import Dict, Optional
 
 from spaik_sdk.config.env import env_config
 from spaik_sdk.prompt.local_prompt_loader import LocalPromptLoader
 from spaik_sdk.prompt.prompt_loader import PromptLoader
 from spaik_sdk.prompt.prompt_loader_mode import PromptLoaderMode
 
+# Shared per prompts dir so the loaded/rendered prompt caches survive across agent instances;
+# LocalPromptLoader checks file mtimes, so edited prompts are still picked up without a restart
+_local_prompt_loaders: Dict[str, LocalPromptLoader] = {}
+
 
 def get_prompt_loader(mode: Optional[PromptLoaderMode] = None) -> PromptLoader:
     mode = mode or env_config.get_prompt_loader_mode()
     if mode == PromptLoaderMode.LOCAL:
-        return LocalPromptLoader()
+        prompts_dir = env_config.get_prompts_dir()
+        loader = _local_prompt_loaders.get(prompts_dir)
+        if loader is None:
+            loader = _local_prompt_loaders[prompts_dir] = LocalPromptLoader(prompts_dir)
+        return loader
     raise ValueError(f"Unknown PromptLoaderMode: {mode}")
@@ -1,5 +1,5 @@
 import os
-from typing import Optional
+from typing import Hashable, Optional
 
 from spaik_sdk.config.env import env_config
 from spaik_sdk.prompt.prompt_loader import PromptLoader
@@ -13,8 +13,18 @@ class LocalPromptLoader(PromptLoader):
         super().__init__()
         self.prompts_dir = prompts_dir if prompts_dir else env_config.get_prompts_dir()
 
+    def _prompt_file_path(self, prompt_path: str) -> str:
+        return os.path.join(self.prompts_dir, f"{prompt_path}.md")
+
+    def _get_prompt_version(self, prompt_path: str) -> Optional[Hashable]:
+        # A stat per lookup keeps the cache fresh when prompt files are edited while the process runs
+        try:
+            return os.stat(self._prompt_file_path(prompt_path)).st_mtime_ns
+        except OSError:
+            return None
+
     def _load_raw_prompt(self, prompt_path: str) -> str:
-        full_path = os.path.join(self.prompts_dir, f"{prompt_path}.md")
+        full_path = self._prompt_file_path(prompt_path)
         if not os.path.exists(full_path):
             raise FileNotFoundError(f"Prompt file {full_path} not found")
         with open(full_path, "r") as f:
@@ -1,5 +1,7 @@
+import threading
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Dict, Optional, Type
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Hashable, Mapping, Optional, Tuple, Type
 
 if TYPE_CHECKING:
     from spaik_sdk.agent.base_agent import BaseAgent
@@ -8,41 +10,82 @@ from spaik_sdk.utils.init_logger import init_logger
 
 logger = init_logger(__name__)
 
+_RENDERED_CACHE_MAX_ENTRIES = 256
+
+RenderedCacheKey = Tuple[str, FrozenSet[Tuple[str, type, Any]]]
+
 
 class PromptLoader(ABC):
     def __init__(self):
-        self._prompts_cache: Dict[str, str] = {}
+        # Raw prompts keyed by path, stored with the version they were loaded at
+        self._prompts_cache: Dict[str, Tuple[Optional[Hashable], str]] = {}
+        # LRU of rendered prompts; each entry remembers the raw prompt it was rendered from
+        self._rendered_cache: OrderedDict[RenderedCacheKey, Tuple[str, str]] = OrderedDict()
+        self._rendered_cache_lock = threading.Lock()
 
     @abstractmethod
     def _load_raw_prompt(self, prompt_path: str) -> str:
         pass
 
+    def _get_prompt_version(self, prompt_path: str) -> Optional[Hashable]:
+        """Return a value that changes when the prompt source changes, or None if prompts never change.
+
+        Loaders are shared process-wide, so overriding this is what lets edited prompts be picked up without a restart.
+        """
+        return None
+
     def _get_raw_prompt(self, prompt_path: str) -> str:
-        if prompt_path in self._prompts_cache:
-            return self._prompts_cache[prompt_path]
-        else:
-            raw_prompt = self._load_raw_prompt(prompt_path)
-            self._prompts_cache[prompt_path] = raw_prompt
-            return raw_prompt
-
-    def _format_prompt(self, prompt: str, params: Dict[str, Any]) -> str:
+        version = self._get_prompt_version(prompt_path)
+        cached = self._prompts_cache.get(prompt_path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        raw_prompt = self._load_raw_prompt(prompt_path)
+        self._prompts_cache[prompt_path] = (version, raw_prompt)
+        return raw_prompt
+
+    def _format_prompt(self, prompt: str, params: Mapping[str, Any]) -> str:
         try:
             return prompt.format(**params)
         except KeyError as e:
             missing_key = str(e).strip("'")
             raise KeyError(f"Missing required variable '{missing_key}' in params: {params} for prompt: '{prompt}'")
 
-    def get_prompt(self, prompt_path: str, params: Dict[str, Any]) -> str:
-        return self._format_prompt(self._get_raw_prompt(prompt_path), params)
+    def _get_rendered_prompt(self, prompt_path: str, params: Mapping[str, Any]) -> str:
+        raw_prompt = self._get_raw_prompt(prompt_path)
+        try:
+            # Include the value types so equal-but-differently-rendered params like 1 and True get their own entries
+            cache_key: RenderedCacheKey = (prompt_path, frozenset((key, type(value), value) for key, value in params.items()))
+        except TypeError:
+            # Unhashable params cannot be used as a cache key, render without caching
+            return self._format_prompt(raw_prompt, params)
+
+        with self._rendered_cache_lock:
+            cached = self._rendered_cache.get(cache_key)
+            if cached is not None and cached[0] is raw_prompt:
+                self._rendered_cache.move_to_end(cache_key)
+                return cached[1]
+
+        rendered = self._format_prompt(raw_prompt, params)
+        with self._rendered_cache_lock:
+            self._rendered_cache[cache_key] = (raw_prompt, rendered)
+            self._rendered_cache.move_to_end(cache_key)
+            while len(self._rendered_cache) > _RENDERED_CACHE_MAX_ENTRIES:
+                self._rendered_cache.popitem(last=False)
+        return rendered
+
+    def get_prompt(self, prompt_path: str, params: Mapping[str, Any]) -> str:
+        return self._get_rendered_prompt(prompt_path, params)
+
+    def _get_agent_prompt_path(self, agent_class: Type["BaseAgent"], prompt_name: str, version: Optional[str] = None) -> str:
+        return f"agent/{agent_class.__name__}/{prompt_name}{f'-{version}' if version else ''}"
 
     def _get_raw_agent_prompt(self, agent_class: Type["BaseAgent"], prompt_name: str, version: Optional[str] = None) -> str:
-        return self._get_raw_prompt(f"agent/{agent_class.__name__}/{prompt_name}{f'-{version}' if version else ''}")
+        return self._get_raw_prompt(self._get_agent_prompt_path(agent_class, prompt_name, version))
 
-    def get_system_prompt(self, agent_class: Type["BaseAgent"], params: Dict[str, Any], version: Optional[str] = None) -> str:
+    def get_system_prompt(self, agent_class: Type["BaseAgent"], params: Mapping[str, Any], version: Optional[str] = None) -> str:
         return self.get_agent_prompt(agent_class, "system", params, version)
 
     def get_agent_prompt(
-        self, agent_class: Type["BaseAgent"], prompt_name: str, params: Dict[str, Any], version: Optional[str] = None
+        self, agent_class: Type["BaseAgent"], prompt_name: str, params: Mapping[str, Any], version: Optional[str] = None
     ) -> str:
-        raw_prompt = self._get_raw_agent_prompt(agent_class, prompt_name, version)
-        return self._format_prompt(raw_prompt, params)
+        return self._get_rendered_prompt(self._get_agent_prompt_path(agent_class, prompt_name, version), params)
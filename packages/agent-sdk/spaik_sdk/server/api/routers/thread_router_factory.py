@@ -195,7 +195,7 @@ class ThreadRouterFactory:
                 id=str(uuid.uuid4()),
                 author_id=user.get_id(),
                 author_name=user.get_name(),
-                timestamp=int(time.time() * 1000),
+                timestamp=time.time_ns() // 1_000_000,
                 ai=False,
                 blocks=[MessageBlock(content=request.content, type=MessageBlockType.PLAIN, id=str(uuid.uuid4()), streaming=False)],
                 attachments=attachments,
@@ -0,0 +1,55 @@
+from collections.abc import AsyncIterator, Callable, Sequence
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from fastapi.middleware.cors import CORSMiddleware
+
+from spaik_sdk.agent.base_agent import BaseAgent
+from spaik_sdk.server.api.routers.api_builder import ApiBuilder
+from spaik_sdk.utils.http_client import close_http_client
+
+
+def make_app(
+    agent_factory: Callable[[], BaseAgent],
+    *,
+    title: str = "Agent SDK Backend",
+    version: str = "0.0.1",
+    include_files: bool = False,
+    include_audio: bool = False,
+    in_memory: bool = False,
+    cors_origins: Sequence[str] = ("*",),
+) -> FastAPI:
+    """
+    Create a FastAPI app serving a single agent with local storage.
+
+    The agent is created and the routers are mounted on startup, so environment
+    variables loaded by the caller (e.g. from .env) are visible to the agent.
+
+    Args:
+        agent_factory: Callable returning the agent that answers thread messages
+        include_files: Mount the /files router
+        include_audio: Mount the /audio router (TTS/STT)
+        in_memory: Keep threads in memory instead of on disk
+        cors_origins: Origins allowed by the CORS middleware
+    """
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        api_builder = ApiBuilder.local(agent=agent_factory(), in_memory=in_memory)
+        app.include_router(api_builder.build_thread_router())
+        if include_files:
+            app.include_router(api_builder.build_file_router())
+        if include_audio:
+            app.include_router(api_builder.build_audio_router())
+        yield
+        await close_http_client()
+
+    app = FastAPI(title=title, version=version, lifespan=lifespan)
+    app.add_middleware(
+        CORSMiddleware,  # type: ignore[arg-type]
+        allow_origins=list(cors_origins),
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    return app
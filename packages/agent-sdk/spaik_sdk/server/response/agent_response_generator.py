@@ -44,6 +44,6 @@ class AgentResponseGenerator(ResponseGenerator):
         return {
             "thread_id": thread_id,
             "event_type": event.get_event_type(),
-            "timestamp": int(time.time() * 1000),
+            "timestamp": time.time_ns() // 1_000_000,
             "data": event.get_event_data(),
         }
@@ -1,7 +1,10 @@
+import asyncio
 import json
+import os
 import pickle
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 from spaik_sdk.server.storage.base_thread_repository import BaseThreadRepository
 from spaik_sdk.server.storage.thread_filter import ThreadFilter
@@ -21,6 +24,9 @@ class LocalFileThreadRepository(BaseThreadRepository):
         # Create directories if they don't exist
         self.threads_dir.mkdir(parents=True, exist_ok=True)
 
+        # Held across each snapshot and its worker-thread write so saves and deletes land on disk in call order
+        self._io_lock = asyncio.Lock()
+
         # Load metadata cache
         self._metadata_cache: Dict[str, ThreadMetadata] = {}
         self._load_metadata_cache()
@@ -50,9 +56,8 @@ class LocalFileThreadRepository(BaseThreadRepository):
                 # If metadata is corrupted, rebuild it
                 self._rebuild_metadata_cache()
 
-    def _save_metadata_cache(self) -> None:
-        """Save metadata cache to disk"""
-        data = {
+    def _serialize_metadata_cache(self) -> Dict[str, Dict[str, Any]]:
+        return {
             thread_id: {
                 "thread_id": metadata.thread_id,
                 "title": metadata.title,
@@ -65,8 +70,23 @@ class LocalFileThreadRepository(BaseThreadRepository):
             for thread_id, metadata in self._metadata_cache.items()
         }
 
-        with open(self.metadata_file, "w") as f:
-            json.dump(data, f, indent=2)
+    def _atomic_write(self, path: Path, data: bytes) -> None:
+        """Write via a temp file and rename, so readers never see a partially written file"""
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _write_metadata(self, data: Dict[str, Dict[str, Any]]) -> None:
+        self._atomic_write(self.metadata_file, json.dumps(data, indent=2).encode("utf-8"))
+
+    def _save_metadata_cache(self) -> None:
+        """Save metadata cache to disk"""
+        self._write_metadata(self._serialize_metadata_cache())
 
     def _rebuild_metadata_cache(self) -> None:
         """Rebuild metadata cache by reading all thread files"""
@@ -101,28 +121,34 @@ class LocalFileThreadRepository(BaseThreadRepository):
         except (pickle.PickleError, EOFError, OSError):
             return None
 
+    def _write_thread_file(self, serializable_thread: ThreadContainer) -> None:
+        self._atomic_write(self._thread_file_path(serializable_thread.thread_id), pickle.dumps(serializable_thread))
+
     def _save_thread_to_file(self, thread: ThreadContainer) -> None:
         """Save thread to pickle file"""
-        file_path = self._thread_file_path(thread.thread_id)
-
         # Create a serializable copy to avoid issues with non-picklable subscribers
-        serializable_thread = thread.create_serializable_copy()
+        self._write_thread_file(thread.create_serializable_copy())
 
-        with open(file_path, "wb") as f:
-            pickle.dump(serializable_thread, f)
+    def _write_thread_and_metadata(self, serializable_thread: ThreadContainer, metadata_data: Dict[str, Dict[str, Any]]) -> None:
+        self._write_thread_file(serializable_thread)
+        self._write_metadata(metadata_data)
 
     async def save_thread(self, thread_container: ThreadContainer) -> None:
         """Save complete thread container to disk"""
-        self._save_thread_to_file(thread_container)
+        async with self._io_lock:
+            # Snapshot on the event loop, where the container is mutated; only the disk writes go to a worker thread
+            serializable_thread = thread_container.create_serializable_copy()
 
-        # Update metadata cache
-        metadata = ThreadMetadata.from_thread_container(thread_container)
-        self._metadata_cache[thread_container.thread_id] = metadata
-        self._save_metadata_cache()
+            # Update metadata cache
+            metadata = ThreadMetadata.from_thread_container(thread_container)
+            self._metadata_cache[thread_container.thread_id] = metadata
+
+            await asyncio.to_thread(self._write_thread_and_metadata, serializable_thread, self._serialize_metadata_cache())
 
     async def load_thread(self, thread_id: str) -> Optional[ThreadContainer]:
         """Load thread container from disk"""
-        return self._load_thread_from_file(thread_id)
+        # Writes replace files atomically, so reads need no lock
+        return await asyncio.to_thread(self._load_thread_from_file, thread_id)
 
     async def get_message(self, thread_id: str, message_id: str) -> Optional[ThreadMessage]:
         """Get message from disk"""
@@ -171,19 +197,21 @@ class LocalFileThreadRepository(BaseThreadRepository):
         """Delete thread and all its messages from disk"""
         file_path = self._thread_file_path(thread_id)
 
-        if file_path.exists():
-            try:
-                file_path.unlink()  # Delete file
-
-                # Remove from metadata cache
-                if thread_id in self._metadata_cache:
-                    del self._metadata_cache[thread_id]
-                    self._save_metadata_cache()
-
-                return True
-            except OSError:
-                return False
-        return False
+        # Wait for in-flight saves so they cannot recreate the file after it is deleted
+        async with self._io_lock:
+            if file_path.exists():
+                try:
+                    file_path.unlink()  # Delete file
+
+                    # Remove from metadata cache
+                    if thread_id in self._metadata_cache:
+                        del self._metadata_cache[thread_id]
+                        await asyncio.to_thread(self._write_metadata, self._serialize_metadata_cache())
+
+                    return True
+                except OSError:
+                    return False
+            return False
 
     async def list_threads(self, filter: ThreadFilter) -> List[ThreadMetadata]:
         """List threads matching the filter from disk metadata"""
@@ -2,7 +2,8 @@
 Simple synchronous adapter for ThreadContainer
 """
 
-from typing import List
+from collections import deque
+from typing import Deque, List
 
 from spaik_sdk.thread.models import ThreadEvent
 from spaik_sdk.thread.thread_container import ThreadContainer
@@ -10,7 +11,8 @@ from spaik_sdk.thread.thread_container import ThreadContainer
 
 class EventAdapter:
     def __init__(self, container: ThreadContainer):
-        self.events: List[ThreadEvent] = []
+        # Consumers may pop events directly from this deque instead of calling flush()
+        self.events: Deque[ThreadEvent] = deque()
         self.container = container
 
         self.container.subscribe(self._handle_event)
@@ -19,8 +21,8 @@ class EventAdapter:
         self.events.append(event)
 
     def flush(self) -> List[ThreadEvent]:
-        ret = self.events
-        self.events = []
+        ret = list(self.events)
+        self.events.clear()
         return ret
 
     def cleanup(self):
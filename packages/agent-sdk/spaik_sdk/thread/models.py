@@ -1,9 +1,9 @@
 import json
 import time
 from abc import ABC
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional
 
 if TYPE_CHECKING:
     from spaik_sdk.attachments.models import Attachment
@@ -18,7 +18,21 @@ class MessageBlockType(Enum):
     ERROR = "error"
 
 
-@dataclass
+def _get_slots_state(obj: Any) -> Dict[str, Any]:
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _set_slots_state(obj: Any, state: Mapping[str, Any]) -> None:
+    # Threads pickled before a field existed (or before the class used __slots__) lack some
+    # entries; those fall back to the field default, as the class attribute used to provide
+    for f in fields(obj):
+        if f.name in state:
+            setattr(obj, f.name, state[f.name])
+        elif f.default is not MISSING:
+            setattr(obj, f.name, f.default)
+
+
+@dataclass(slots=True)
 class MessageBlock:
     id: str
     streaming: bool
@@ -32,6 +46,14 @@ class MessageBlock:
     tool_call_response: Optional[str] = None
     tool_call_error: Optional[str] = None
 
+    # Pickle as a plain dict, the state the class had before it used __slots__, so persisted
+    # threads stay loadable in both directions.
+    def __getstate__(self) -> Dict[str, Any]:
+        return _get_slots_state(self)
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        _set_slots_state(self, state)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "id": self.id,
@@ -47,7 +69,7 @@ class MessageBlock:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ThreadMessage:
     id: str
     ai: bool
@@ -58,6 +80,12 @@ class ThreadMessage:
     consumption_metadata: Optional["TokenUsage"] = None
     attachments: Optional[List["Attachment"]] = None
 
+    def __getstate__(self) -> Dict[str, Any]:
+        return _get_slots_state(self)
+
+    def __setstate__(self, state: Mapping[str, Any]) -> None:
+        _set_slots_state(self, state)
+
     def get_text_content(self) -> str:
         return "\n".join([(block.content or "") for block in self.blocks if block.type == MessageBlockType.PLAIN])
 
@@ -124,7 +152,7 @@ class ThreadEvent(ABC):
             {
                 "thread_id": thread_id,
                 "event_type": self.get_event_type(),
-                "timestamp": int(time.time() * 1000),
+                "timestamp": time.time_ns() // 1_000_000,
                 "data": self.get_event_data(),
             }
         )
@@ -1,7 +1,7 @@
 import copy
 import time
 import uuid
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 from langchain_core.messages import BaseMessage, SystemMessage
 
@@ -40,7 +40,7 @@ class ThreadContainer:
         self._subscribers: List[Callable[[ThreadEvent], None]] = []
 
         self._version = 0
-        self._last_activity_time = int(time.time() * 1000)
+        self._last_activity_time = time.time_ns() // 1_000_000
         self.thread_id = str(uuid.uuid4())
         self.job_id = "unknown"
 
@@ -61,7 +61,7 @@ class ThreadContainer:
 
     def _increment_version(self) -> None:
         self._version += 1
-        self._last_activity_time = int(time.time() * 1000)
+        self._last_activity_time = time.time_ns() // 1_000_000
 
     def get_version(self) -> int:
         return self._version
@@ -158,7 +158,7 @@ class ThreadContainer:
             ai=True,
             author_id=author_id,
             author_name=author_name,
-            timestamp=int(time.time() * 1000),
+            timestamp=time.time_ns() // 1_000_000,
             blocks=[
                 MessageBlock(
                     id=str(uuid.uuid4()),
@@ -294,8 +294,19 @@ class ThreadContainer:
                     return message.id
         return None
 
-    def get_langchain_messages(self) -> List[BaseMessage]:
-        messages: List[BaseMessage] = [SystemMessage(content=self.get_system_prompt())]
+    def get_system_message(self, cache_control: Optional[Dict[str, Any]] = None) -> SystemMessage:
+        """Build the system message, optionally marking it as a cacheable prompt prefix.
+
+        The system prompt is the stable prefix of every request, so it must stay byte-identical
+        between turns for provider-side prompt caching to hit. Per-request data belongs in the
+        user turn, not in the system prompt.
+        """
+        if cache_control is None:
+            return SystemMessage(content=self.get_system_prompt())
+        return SystemMessage(content=[{"type": "text", "text": self.get_system_prompt(), "cache_control": cache_control}])
+
+    def get_langchain_messages(self, cache_control: Optional[Dict[str, Any]] = None) -> List[BaseMessage]:
+        messages: List[BaseMessage] = [self.get_system_message(cache_control)]
         messages.extend(convert_thread_message_to_langchain(msg) for msg in self.messages)
         return messages
 
@@ -303,8 +314,9 @@ class ThreadContainer:
         self,
         file_storage: BaseFileStorage,
         provider_family: str = "openai",
+        cache_control: Optional[Dict[str, Any]] = None,
     ) -> List[BaseMessage]:
-        messages: List[BaseMessage] = [SystemMessage(content=self.get_system_prompt())]
+        messages: List[BaseMessage] = [self.get_system_message(cache_control)]
         for msg in self.messages:
             converted = await convert_thread_message_to_langchain_multimodal(
                 msg,
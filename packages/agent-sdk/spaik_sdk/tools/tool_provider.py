@@ -1,5 +1,6 @@
 import json
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from langchain_core.tools import BaseTool, StructuredTool, tool
@@ -26,6 +27,16 @@ class ToolProvider(ABC):
         """
         pass
 
+    @cached_property
+    def tools(self) -> List[BaseTool]:
+        """
+        Tools of this provider, built with get_tools() once per provider instance.
+
+        Returns:
+            List[BaseTool]: The cached Langchain tools
+        """
+        return self.get_tools()
+
     def get_provider_id(self) -> str:
         return f"{self.__class__.__module__}.{self.__class__.__qualname__}"
 
@@ -0,0 +1,166 @@
+import asyncio
+import importlib.util
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from spaik_sdk.config.env import env_config
+from spaik_sdk.utils.init_logger import init_logger
+
+logger = init_logger(__name__)
+
+_AIOHTTP_AVAILABLE = importlib.util.find_spec("aiohttp") is not None
+
+# httpx pools (and aiohttp sessions) are bound to the event loop they were first used on, so keep one client per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_aiohttp_sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+
+
+@dataclass
+class HttpResponse:
+    status_code: int
+    content: bytes
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+@dataclass
+class StreamingHttpResponse:
+    """Backend-neutral view of a response whose body has not been read yet."""
+
+    status_code: int
+    _read: Callable[[], Awaitable[bytes]]
+    _iter_chunks: Callable[[int], AsyncIterator[bytes]]
+
+    async def aread(self) -> bytes:
+        return await self._read()
+
+    def aiter_bytes(self, chunk_size: int) -> AsyncIterator[bytes]:
+        return self._iter_chunks(chunk_size)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the pooled keep-alive client for the running event loop.
+
+    Shared by the provider HTTP calls (STT, TTS) so repeated requests reuse open connections
+    instead of paying a TCP/TLS handshake each time. Callers must not close it.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0),
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50, keepalive_expiry=30.0),
+        )
+        _clients[loop] = client
+    return client
+
+
+def _get_aiohttp_session() -> Any:
+    import aiohttp
+
+    loop = asyncio.get_running_loop()
+    session = _aiohttp_sessions.get(loop)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=200, limit_per_host=50, ttl_dns_cache=300, keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=120),
+        )
+        _aiohttp_sessions[loop] = session
+    return session
+
+
+def _use_aiohttp() -> bool:
+    if env_config.get_http_client_backend() != "aiohttp":
+        return False
+    if not _AIOHTTP_AVAILABLE:
+        logger.warning("HTTP_CLIENT_BACKEND=aiohttp but aiohttp is not installed (pip install 'spaik-sdk[aiohttp]'), falling back to httpx")
+        return False
+    return True
+
+
+async def _aiohttp_post(
+    url: str,
+    headers: Mapping[str, str],
+    json: Optional[Any],
+    data: Optional[Mapping[str, str]],
+    files: Optional[Mapping[str, Tuple[str, bytes, str]]],
+) -> HttpResponse:
+    import aiohttp
+
+    body: Any = None
+    if files:
+        form = aiohttp.FormData()
+        for name, (filename, content, content_type) in files.items():
+            form.add_field(name, content, filename=filename, content_type=content_type)
+        for name, value in (data or {}).items():
+            form.add_field(name, value)
+        body = form
+    elif data:
+        body = dict(data)
+
+    async with _get_aiohttp_session().post(url, headers=dict(headers), json=json, data=body) as response:
+        return HttpResponse(status_code=response.status, content=await response.read())
+
+
+async def post(
+    url: str,
+    headers: Mapping[str, str],
+    *,
+    json: Optional[Any] = None,
+    data: Optional[Mapping[str, str]] = None,
+    files: Optional[Mapping[str, Tuple[str, bytes, str]]] = None,
+) -> HttpResponse:
+    """POST through the pooled client of the configured backend (HTTP_CLIENT_BACKEND).
+
+    files maps a form field to (filename, content, content_type) and is sent as multipart
+    together with data.
+    """
+    if _use_aiohttp():
+        return await _aiohttp_post(url, headers, json, data, files)
+    kwargs: Dict[str, Any] = {"headers": dict(headers)}
+    if json is not None:
+        kwargs["json"] = json
+    if data is not None:
+        kwargs["data"] = data
+    if files is not None:
+        kwargs["files"] = files
+    response = await get_http_client().post(url, **kwargs)
+    return HttpResponse(status_code=response.status_code, content=response.content)
+
+
+@asynccontextmanager
+async def stream_post(
+    url: str,
+    headers: Mapping[str, str],
+    *,
+    json: Optional[Any] = None,
+) -> AsyncIterator[StreamingHttpResponse]:
+    """POST through the configured backend (HTTP_CLIENT_BACKEND) and expose the body as a stream."""
+    if _use_aiohttp():
+        import aiohttp
+
+        # Like httpx's timeout, bound each read rather than the whole (possibly long) stream
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=120, sock_read=120)
+        async with _get_aiohttp_session().post(url, headers=dict(headers), json=json, timeout=timeout) as aiohttp_response:
+            yield StreamingHttpResponse(aiohttp_response.status, aiohttp_response.read, aiohttp_response.content.iter_chunked)
+        return
+
+    async with get_http_client().stream("POST", url, headers=dict(headers), json=json) as response:
+        yield StreamingHttpResponse(response.status_code, response.aread, lambda chunk_size: response.aiter_bytes(chunk_size=chunk_size))
+
+
+async def close_http_client() -> None:
+    """Close the pooled clients of the running event loop, e.g. on server shutdown."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+    session = _aiohttp_sessions.pop(loop, None)
+    if session is not None:
+        await session.close()
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import weakref
+from typing import Any, Coroutine, TypeVar
+
+R = TypeVar("R")
+
+_thread_local = threading.local()
+
+
+class _LoopHolder:
+    """Owns a thread's loop; the loop is finalized when the holder goes away with the thread, or at exit"""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        weakref.finalize(self, _close_loop, loop)
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        return asyncio.new_event_loop()
+    return uvloop.new_event_loop()
+
+
+def _cancel_leftover_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _close_loop(loop: asyncio.AbstractEventLoop) -> None:
+    """Same teardown as asyncio.run: cancel tasks, shut down async generators and the default executor, close"""
+    if loop.is_closed():
+        return
+    try:
+        _cancel_leftover_tasks(loop)
+        loop.run_until_complete(loop.shutdown_asyncgens())
+        loop.run_until_complete(loop.shutdown_default_executor())
+    except RuntimeError:
+        # Finalized from a thread running another loop, or too late in interpreter shutdown; closing is all that is left
+        pass
+    finally:
+        loop.close()
+
+
+def run_sync(coro: Coroutine[Any, Any, R]) -> R:
+    """Run a coroutine to completion on this thread's persistent event loop.
+
+    Unlike asyncio.run, the loop is reused across calls: repeated sync calls skip loop setup and
+    teardown, and async clients cached by LangChain models stay bound to a live loop. Tasks the
+    coroutine leaves behind are cancelled after each call, and the loop is fully shut down when
+    its thread exits or the interpreter does. uvloop is used when it is installed.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        coro.close()
+        raise RuntimeError("run_sync() cannot be called from a running event loop")
+
+    holder = getattr(_thread_local, "holder", None)
+    if holder is None or holder.loop.is_closed():
+        holder = _thread_local.holder = _LoopHolder(_new_event_loop())
+    loop = holder.loop
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        _cancel_leftover_tasks(loop)
@@ -305,6 +305,33 @@ class TestBaseAgent:
         assert agent.tools == []
         assert agent.llm_config.tool_usage is False
 
+    def test_tool_provider_tools_are_built_once_per_provider(self):
+        provider = TestToolProvider()
+        calls = []
+        original_get_tools = provider.get_tools
+
+        def counting_get_tools() -> List[BaseTool]:
+            calls.append(1)
+            return original_get_tools()
+
+        provider.get_tools = counting_get_tools  # type: ignore[method-assign]
+
+        first = DefaultToolProviderAgent(tool_providers=[provider])
+        second = DefaultToolProviderAgent(tool_providers=[provider])
+
+        assert len(calls) == 1
+        assert first.tools == second.tools
+
+    def test_structured_llm_config_is_reused_until_llm_config_changes(self):
+        agent = DefaultToolProviderAgent(tools=[])
+
+        structured_config = agent._get_structured_llm_config()
+        assert structured_config.structured_response is True
+        assert agent._get_structured_llm_config() is structured_config
+
+        agent.llm_config = agent.create_llm_config()
+        assert agent._get_structured_llm_config() is not structured_config
+
 
 @pytest.mark.unit
 class TestBaseAgentInstanceId:
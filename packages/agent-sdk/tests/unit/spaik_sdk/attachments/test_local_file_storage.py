@@ -0,0 +1,63 @@
+import pytest
+
+from spaik_sdk.attachments.builder import AttachmentBuilder
+from spaik_sdk.attachments.storage.impl.local_file_storage import LocalFileStorage
+
+
+async def chunked(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.unit
+class TestLocalFileStorage:
+    @pytest.mark.asyncio
+    async def test_store_stream_writes_all_chunks(self, tmp_path):
+        storage = LocalFileStorage(data_dir=str(tmp_path))
+
+        metadata = await storage.store_stream(chunked(b"abc", b"def"), mime_type="text/plain", owner_id="user", filename="a.txt")
+
+        data, stored_metadata = await storage.retrieve(metadata.file_id)
+        assert data == b"abcdef"
+        assert stored_metadata.size_bytes == 6
+        assert stored_metadata.filename == "a.txt"
+
+    @pytest.mark.asyncio
+    async def test_store_stream_leaves_nothing_behind_when_the_stream_fails(self, tmp_path):
+        storage = LocalFileStorage(data_dir=str(tmp_path))
+
+        async def failing_chunks():
+            yield b"abc"
+            raise ConnectionError("download interrupted")
+
+        with pytest.raises(ConnectionError):
+            await storage.store_stream(failing_chunks(), mime_type="text/plain", owner_id="user")
+
+        assert list(storage.files_dir.iterdir()) == []
+        assert list(storage.metadata_dir.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_attachment_builder_from_paths_preserves_order(self, tmp_path):
+        storage = LocalFileStorage(data_dir=str(tmp_path / "storage"))
+        paths = []
+        for i in range(20):
+            path = tmp_path / f"file_{i}.txt"
+            path.write_text(f"content {i}")
+            paths.append(path)
+
+        attachments = await AttachmentBuilder(storage).from_paths(paths)
+
+        assert [attachment.filename for attachment in attachments] == [path.name for path in paths]
+        for i, attachment in enumerate(attachments):
+            data, _ = await storage.retrieve(attachment.file_id)
+            assert data == f"content {i}".encode()
+
+    @pytest.mark.asyncio
+    async def test_retrieve_many_returns_files_in_order_with_none_for_missing(self, tmp_path):
+        storage = LocalFileStorage(data_dir=str(tmp_path))
+        first = await storage.store(b"first", mime_type="text/plain", owner_id="user")
+        second = await storage.store(b"second", mime_type="text/plain", owner_id="user")
+
+        results = await storage.retrieve_many([second.file_id, "missing", first.file_id])
+
+        assert [result[0] if result else None for result in results] == [b"second", None, b"first"]
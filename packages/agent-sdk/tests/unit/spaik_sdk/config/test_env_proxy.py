@@ -64,3 +64,12 @@ class TestEnvConfigProxy:
     def test_get_proxy_headers_skips_malformed(self, monkeypatch):
         monkeypatch.setenv("LLM_PROXY_HEADERS", "valid:header,nocolon,another:good")
         assert self.config.get_proxy_headers() == {"valid": "header", "another": "good"}
+
+    def test_get_proxy_headers_follows_env_changes_and_returns_fresh_dict(self, monkeypatch):
+        monkeypatch.setenv("LLM_PROXY_HEADERS", "X-Custom:value1")
+        headers = self.config.get_proxy_headers()
+        headers["X-Mutated"] = "yes"
+        assert self.config.get_proxy_headers() == {"X-Custom": "value1"}
+
+        monkeypatch.setenv("LLM_PROXY_HEADERS", "X-Custom:value2")
+        assert self.config.get_proxy_headers() == {"X-Custom": "value2"}
@@ -0,0 +1,21 @@
+import pytest
+
+from spaik_sdk.config import get_credentials_provider as module
+from spaik_sdk.config.env_credentials_provider import EnvCredentialsProvider
+
+
+@pytest.mark.unit
+class TestGetCredentialsProvider:
+    def test_provider_type_is_resolved_on_first_use(self, monkeypatch):
+        monkeypatch.setattr(module, "_credentials_provider", None)
+        monkeypatch.setenv("CREDENTIALS_PROVIDER_TYPE", "vault")
+
+        with pytest.raises(ValueError, match="vault"):
+            module.credentials_provider.get_provider_key("openai")
+
+        monkeypatch.setenv("CREDENTIALS_PROVIDER_TYPE", "env")
+        monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+        assert module.credentials_provider.get_provider_key("openai") == "sk-test"
+        assert isinstance(module.get_credentials_provider(), EnvCredentialsProvider)
+        assert module.get_credentials_provider() is module.get_credentials_provider()
@@ -0,0 +1,53 @@
+import pytest
+
+from spaik_sdk.image_gen import image_generator
+from spaik_sdk.image_gen.image_generator import ImageGenerator
+from spaik_sdk.image_gen.options import ImageFormat, ImageGenOptions
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    calls = []
+
+    async def generate_image(**kwargs):
+        calls.append(kwargs)
+        return b"\x89PNG fake"
+
+    monkeypatch.setattr(image_generator.openai_provider, "generate_image", generate_image)
+    monkeypatch.setattr(image_generator.credentials_provider, "get_provider_key", lambda provider: "test-key")
+    return calls
+
+
+@pytest.mark.unit
+class TestImageGenerator:
+    async def test_generate_image_bytes_does_not_touch_disk(self, fake_openai, tmp_path):
+        generator = ImageGenerator(model="gpt-image-1", output_dir=str(tmp_path / "out"))
+
+        image_bytes = await generator.generate_image_bytes("a cat")
+
+        assert image_bytes == b"\x89PNG fake"
+        assert fake_openai[0]["prompt"] == "a cat"
+        assert not (tmp_path / "out").exists()
+
+    async def test_generate_image_writes_file(self, fake_openai, tmp_path):
+        generator = ImageGenerator(model="gpt-image-1", output_dir=str(tmp_path / "out"))
+
+        path = await generator.generate_image("a cat", ImageGenOptions(output_format=ImageFormat.PNG), output_filename="cat.png")
+
+        assert path == tmp_path / "out" / "cat.png"
+        assert path.read_bytes() == b"\x89PNG fake"
+
+    def test_slugify_collapses_non_alphanumeric_runs(self):
+        assert image_generator._slugify("  A Café -- at NIGHT!  ") == "a_caf_at_night"
+        assert image_generator._slugify("x" * 80) == "x" * 50
+
+    def test_provider_follows_model_changes(self, tmp_path):
+        generator = ImageGenerator(model="gpt-image-1", output_dir=str(tmp_path))
+        assert generator._get_provider() == "openai"
+
+        generator.model = "gemini-2.5-flash-image"
+        assert generator._get_provider() == "google"
+
+        generator.model = "dall-e-3"
+        with pytest.raises(ValueError, match="dall-e-3"):
+            generator._get_provider()
@@ -1,6 +1,8 @@
 import pytest
 
 from spaik_sdk.llm.cost.builtin_cost_provider import BuiltinCostProvider
+from spaik_sdk.models.llm_families import LLMFamilies
+from spaik_sdk.models.llm_model import LLMModel
 from spaik_sdk.models.model_registry import ModelRegistry
 
 
@@ -25,3 +27,20 @@ class TestBuiltinCostProvider:
         assert pricing.input_tokens == expected_input
         assert pricing.output_tokens == expected_output
         assert pricing.cache_read_tokens == expected_cache_read
+
+    @pytest.mark.parametrize(
+        "name,expected_input,expected_output",
+        [
+            ("gpt-5.1-codex-mini", 25, 200),
+            ("gpt-5-nano", 5, 40),
+            ("gpt-5.2", 125, 1000),
+            ("claude-opus-4-1", 1500, 7500),
+            ("unknown-model", 0, 0),
+        ],
+    )
+    def test_pricing_rule_precedence(self, name: str, expected_input: int, expected_output: int):
+        model = LLMModel(family=LLMFamilies.OPENAI, name=name)
+
+        pricing = BuiltinCostProvider().get_token_pricing(model)
+
+        assert (pricing.input_tokens, pricing.output_tokens) == (expected_input, expected_output)
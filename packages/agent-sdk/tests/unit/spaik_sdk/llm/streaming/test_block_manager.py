@@ -0,0 +1,77 @@
+import itertools
+
+import pytest
+
+from spaik_sdk.llm.streaming import block_manager as block_manager_module
+from spaik_sdk.llm.streaming.block_manager import BlockManager
+from spaik_sdk.llm.streaming.models import EventType
+
+
+@pytest.mark.unit
+class TestBlockManager:
+    @pytest.fixture(autouse=True)
+    def ticking_clock(self, monkeypatch):
+        clock = itertools.count(1)
+        monkeypatch.setattr(block_manager_module.time, "monotonic_ns", lambda: next(clock))
+
+    def test_tool_call_after_reasoning_starts_a_new_reasoning_block(self):
+        manager = BlockManager()
+        manager.ensure_reasoning_block("message-1")
+        assert manager.should_create_new_reasoning_block() is False
+
+        manager.ensure_tool_use_block("message-1", "call-1", "search", {})
+        assert manager.should_create_new_reasoning_block() is True
+
+        manager.reset_reasoning_block()
+        manager.ensure_reasoning_block("message-1")
+        assert manager.should_create_new_reasoning_block() is False
+
+    def test_tool_call_before_reasoning_does_not_split_it(self):
+        manager = BlockManager()
+        manager.ensure_tool_use_block("message-1", "call-1", "search", {})
+        manager.ensure_reasoning_block("message-1")
+
+        assert manager.should_create_new_reasoning_block() is False
+
+        manager.reset()
+        assert manager.should_create_new_reasoning_block() is False
+
+    def test_block_ids_keep_creation_order_without_reset_reasoning_blocks(self):
+        manager = BlockManager()
+        manager.ensure_reasoning_block("message-1")
+        first_reasoning = manager.get_reasoning_block_id()
+        manager.ensure_tool_use_block("message-1", "call-1", "search", {})
+        manager.reset_reasoning_block()
+        manager.ensure_reasoning_block("message-1")
+        manager.ensure_regular_block("message-1")
+
+        assert manager.get_block_ids() == [
+            manager.get_tool_use_block_id("call-1"),
+            manager.get_reasoning_block_id(),
+            manager.get_regular_block_id(),
+        ]
+        assert first_reasoning not in manager.get_block_ids()
+
+    def test_ensure_summary_block_creates_the_block_once(self):
+        manager = BlockManager()
+        manager.ensure_summary_block("message-1")
+        summary_block_id = manager.get_summary_block_id()
+        manager.ensure_summary_block("message-1")
+
+        assert summary_block_id is not None
+        assert manager.get_summary_block_id() == summary_block_id
+        assert manager.get_block_ids() == [summary_block_id]
+
+    def test_ensure_block_returns_block_start_only_when_a_block_is_created(self):
+        manager = BlockManager()
+        block_start = manager.ensure_regular_block("message-1")
+
+        assert block_start is not None
+        assert block_start.event_type == EventType.BLOCK_START
+        assert block_start.block_id == manager.get_regular_block_id()
+        assert manager.ensure_regular_block("message-1") is None
+
+        assert manager.ensure_tool_use_block("message-1", "call-1", "search", {}) is not None
+        assert manager.ensure_tool_use_block("message-1", "call-1", "search", {}) is None
+        # Text after a tool call goes into a new plain block
+        assert manager.ensure_regular_block("message-1") is not None
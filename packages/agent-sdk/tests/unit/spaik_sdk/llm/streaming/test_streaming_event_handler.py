@@ -134,6 +134,23 @@ class TestStreamingEventHandler:
         assert len(token_events) == 1
         assert token_events[0].content == "Hello"
 
+    @pytest.mark.asyncio
+    async def test_skips_empty_text_parts_in_list_content(self):
+        handler = StreamingEventHandler()
+        empty_start = AIMessageChunk(content=[{"type": "text", "text": "", "index": 0}])
+        tool_call = {"name": "search", "args": {"q": "x"}, "id": "call-1"}
+        raw_events = [
+            {"event": "on_chat_model_stream", "data": {"chunk": empty_start}},
+            make_chat_model_stream_event("", tool_calls=[tool_call]),
+            make_chain_end_event(),
+        ]
+
+        events = await collect_events(handler, raw_events)
+
+        block_starts = [e for e in events if e.event_type == EventType.BLOCK_START]
+        assert [e.block_type.value for e in block_starts] == ["tool_use"]
+        assert not [e for e in events if e.event_type == EventType.TOKEN]
+
     @pytest.mark.asyncio
     async def test_extracts_usage_metadata(self):
         handler = StreamingEventHandler()
@@ -299,3 +316,17 @@ class TestStreamingEventHandler:
         assert len(tool_use_events) == 2
         assert tool_use_events[0].tool_args == {}
         assert tool_use_events[-1].tool_args == {"prompt": "portrait of Seppo Hovi"}
+
+    @pytest.mark.parametrize(
+        ("arguments", "expected_args"),
+        [
+            ('{"query": "weather", "limit": 5}', {"query": "weather", "limit": 5}),
+            ('{"id": 123456789012345678901234567890}', {"id": 123456789012345678901234567890}),
+            ('{"query": ', {}),
+        ],
+    )
+    def test_decodes_function_call_arguments(self, arguments, expected_args):
+        handler = StreamingEventHandler()
+        block = {"type": "function_call", "call_id": "call-1", "name": "search", "arguments": arguments}
+
+        assert handler._extract_tool_call_from_content_block(block) == ("call-1", "search", expected_args)
@@ -1,11 +1,15 @@
+import base64
 import json
 import time
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from langchain_core.messages import AIMessage
 
+from spaik_sdk.attachments.models import Attachment
+from spaik_sdk.attachments.storage.impl.local_file_storage import LocalFileStorage
+from spaik_sdk.llm import converters
 from spaik_sdk.llm.converters import convert_thread_message_to_langchain, convert_thread_message_to_langchain_multimodal
 from spaik_sdk.thread.models import MessageBlock, MessageBlockType, ThreadMessage
 from spaik_sdk.tools.tool_provider import BaseTool, ToolProvider
@@ -191,3 +195,99 @@ class TestConverters:
         )
 
         assert converted.content == '<custom_tool_call tool="search_docs" id="call-1"/>'
+
+    @pytest.mark.asyncio
+    async def test_convert_thread_message_to_langchain_multimodal_encodes_attachment_once(self):
+        file_storage = MagicMock()
+        file_storage.retrieve_many = AsyncMock(return_value=[(b"\x89PNG", MagicMock())])
+        file_storage.exists = AsyncMock(return_value=True)
+        thread_message = ThreadMessage(
+            id="message-1",
+            ai=False,
+            author_id="user",
+            author_name="user",
+            timestamp=int(time.time() * 1000),
+            blocks=[],
+            attachments=[Attachment(file_id="file-1", mime_type="image/png")],
+        )
+
+        first = await convert_thread_message_to_langchain_multimodal(thread_message, file_storage=file_storage)
+        second = await convert_thread_message_to_langchain_multimodal(
+            thread_message,
+            file_storage=file_storage,
+            provider_family="anthropic",
+        )
+
+        assert first.content == [{"type": "image_url", "image_url": {"url": "data:image/png;base64,iVBORw=="}}]
+        assert second.content == [{"type": "image", "source": {"type": "base64", "media_type": "image/png", "data": "iVBORw=="}}]
+        file_storage.retrieve_many.assert_awaited_once_with(["file-1"])
+
+    @pytest.mark.asyncio
+    async def test_convert_thread_message_to_langchain_multimodal_reads_attachments_in_one_batch(self):
+        file_storage = MagicMock()
+        file_storage.retrieve_many = AsyncMock(return_value=[(b"first", MagicMock()), None, (b"second", MagicMock())])
+        thread_message = ThreadMessage(
+            id="message-1",
+            ai=False,
+            author_id="user",
+            author_name="user",
+            timestamp=int(time.time() * 1000),
+            blocks=[],
+            attachments=[
+                Attachment(file_id="batch-1", mime_type="image/png"),
+                Attachment(file_id="skipped", mime_type="application/x-unknown", filename="data.bin"),
+                Attachment(file_id="batch-missing", mime_type="image/png"),
+                Attachment(file_id="batch-2", mime_type="image/png"),
+            ],
+        )
+
+        converted = await convert_thread_message_to_langchain_multimodal(thread_message, file_storage=file_storage)
+
+        file_storage.retrieve_many.assert_awaited_once_with(["batch-1", "batch-missing", "batch-2"])
+        assert isinstance(converted.content, list)
+        assert [part["type"] for part in converted.content] == ["image_url", "text", "image_url"]  # type: ignore[index]
+        assert converted.content[0]["image_url"]["url"].endswith(base64.b64encode(b"first").decode())  # type: ignore[index]
+        assert "data.bin" in converted.content[1]["text"]  # type: ignore[index]
+        assert converted.content[2]["image_url"]["url"].endswith(base64.b64encode(b"second").decode())  # type: ignore[index]
+
+    @pytest.mark.asyncio
+    async def test_convert_thread_message_to_langchain_multimodal_does_not_serve_deleted_attachments(self, tmp_path):
+        file_storage = LocalFileStorage(data_dir=str(tmp_path))
+        metadata = await file_storage.store(b"\x89PNG", mime_type="image/png", owner_id="user")
+        thread_message = ThreadMessage(
+            id="message-1",
+            ai=False,
+            author_id="user",
+            author_name="user",
+            timestamp=int(time.time() * 1000),
+            blocks=[],
+            attachments=[Attachment(file_id=metadata.file_id, mime_type="image/png")],
+        )
+
+        first = await convert_thread_message_to_langchain_multimodal(thread_message, file_storage=file_storage)
+        await file_storage.delete(metadata.file_id)
+        second = await convert_thread_message_to_langchain_multimodal(thread_message, file_storage=file_storage)
+
+        assert first.content == [{"type": "image_url", "image_url": {"url": "data:image/png;base64,iVBORw=="}}]
+        assert second.content != first.content
+
+    @pytest.mark.asyncio
+    async def test_convert_thread_message_to_langchain_multimodal_does_not_cache_large_attachments(self, monkeypatch):
+        monkeypatch.setattr(converters, "_ENCODED_ATTACHMENT_MAX_CACHED_BYTES", 4)
+        file_storage = MagicMock()
+        file_storage.retrieve_many = AsyncMock(return_value=[(b"larger than the limit", MagicMock())])
+        file_storage.exists = AsyncMock(return_value=True)
+        thread_message = ThreadMessage(
+            id="message-1",
+            ai=False,
+            author_id="user",
+            author_name="user",
+            timestamp=int(time.time() * 1000),
+            blocks=[],
+            attachments=[Attachment(file_id="large-file", mime_type="image/png")],
+        )
+
+        await convert_thread_message_to_langchain_multimodal(thread_message, file_storage=file_storage)
+        await convert_thread_message_to_langchain_multimodal(thread_message, file_storage=file_storage)
+
+        assert file_storage.retrieve_many.await_count == 2
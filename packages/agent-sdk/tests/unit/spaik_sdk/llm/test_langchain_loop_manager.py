@@ -0,0 +1,181 @@
+import asyncio
+
+import pytest
+
+from spaik_sdk.llm import langchain_loop_manager
+
+
+@pytest.mark.unit
+class TestWebServerContextDetection:
+    async def test_positive_detection_is_remembered_per_loop(self, monkeypatch):
+        calls = []
+
+        def detect(loop):
+            calls.append(loop)
+            return True
+
+        monkeypatch.setattr(langchain_loop_manager, "_detect_web_server_context", detect)
+
+        assert langchain_loop_manager._is_in_web_server_context() is True
+        assert langchain_loop_manager._is_in_web_server_context() is True
+        assert len(calls) == 1
+
+    async def test_negative_detection_is_rechecked(self, monkeypatch):
+        calls = []
+
+        def detect(loop):
+            calls.append(loop)
+            return False
+
+        monkeypatch.setattr(langchain_loop_manager, "_detect_web_server_context", detect)
+
+        assert langchain_loop_manager._is_in_web_server_context() is False
+        assert langchain_loop_manager._is_in_web_server_context() is False
+        assert len(calls) == 2
+
+    def test_no_running_loop_is_not_a_web_server(self):
+        assert langchain_loop_manager._is_in_web_server_context() is False
+
+    async def test_detects_web_framework_frames_on_the_stack(self):
+        namespace = {"detect": langchain_loop_manager._detect_web_server_context, "asyncio": asyncio}
+        exec(compile("result = detect(asyncio.get_running_loop())", "/site-packages/uvicorn/server.py", "exec"), namespace)
+
+        assert namespace["result"] is True
+
+
+@pytest.fixture
+def manager():
+    manager = langchain_loop_manager.LangChainLoopManager()
+    yield manager
+    loop, thread = manager._loop, manager._loop_thread
+    if loop is not None and thread is not None:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=5)
+        loop.close()
+
+
+@pytest.mark.unit
+class TestLangChainLoopManager:
+    def test_loop_is_ready_as_soon_as_it_is_returned(self, manager):
+        async def answer():
+            return 42
+
+        loop = manager.get_loop()
+
+        assert manager.get_loop() is loop
+        assert asyncio.run_coroutine_threadsafe(answer(), loop).result(timeout=5) == 42
+
+    async def test_run_in_loop_does_not_block_the_caller_loop(self, manager):
+        ticks = []
+
+        async def slow_answer():
+            await asyncio.sleep(0.05)
+            return 42
+
+        async def tick():
+            for _ in range(3):
+                ticks.append(None)
+                await asyncio.sleep(0.005)
+
+        result, _ = await asyncio.gather(manager.run_in_loop(slow_answer()), tick())
+
+        assert result == 42
+        assert len(ticks) == 3
+
+    async def test_stream_in_loop_yields_items_as_they_are_produced(self, manager):
+        release = asyncio.Event()
+        caller_loop = asyncio.get_running_loop()
+
+        async def produce():
+            yield 1
+            # Only continue once the caller has seen the first item
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(release.wait(), caller_loop))
+            yield 2
+            raise ValueError("boom")
+
+        received = []
+        with pytest.raises(ValueError, match="boom"):
+            async for item in manager.stream_in_loop(produce()):
+                received.append(item)
+                release.set()
+
+        assert received == [1, 2]
+
+    async def test_stream_in_loop_ends_when_the_generator_is_cancelled(self, manager, monkeypatch):
+        monkeypatch.setattr(langchain_loop_manager, "STREAM_QUEUE_SIZE", 1)
+
+        async def produce():
+            yield 1
+            yield 2
+            raise asyncio.CancelledError()
+
+        received = []
+
+        async def consume():
+            async for item in manager.stream_in_loop(produce()):
+                await asyncio.sleep(0.01)
+                received.append(item)
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(consume(), timeout=5)
+
+        assert received == [1, 2]
+
+    async def test_stream_in_loop_ends_when_the_producer_task_is_cancelled(self, manager):
+        started = asyncio.Event()
+        caller_loop = asyncio.get_running_loop()
+
+        async def produce():
+            caller_loop.call_soon_threadsafe(started.set)
+            await asyncio.sleep(60)
+            yield 1
+
+        async def consume():
+            return [item async for item in manager.stream_in_loop(produce())]
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.wait_for(started.wait(), timeout=5)
+        langchain_loop = manager.get_loop()
+        langchain_loop.call_soon_threadsafe(lambda: [task.cancel() for task in asyncio.all_tasks(langchain_loop)])
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(consumer, timeout=5)
+
+    async def test_stream_in_loop_closes_the_generator_when_the_caller_stops(self, manager):
+        closed = asyncio.Event()
+        caller_loop = asyncio.get_running_loop()
+
+        async def produce():
+            try:
+                while True:
+                    yield 1
+                    await asyncio.sleep(0.001)
+            finally:
+                caller_loop.call_soon_threadsafe(closed.set)
+
+        stream = manager.stream_in_loop(produce())
+        async for _ in stream:
+            break
+        await stream.aclose()
+
+        await asyncio.wait_for(closed.wait(), timeout=5)
+
+    async def test_stream_in_loop_producer_waits_for_a_slow_consumer(self, manager, monkeypatch):
+        monkeypatch.setattr(langchain_loop_manager, "STREAM_QUEUE_SIZE", 2)
+        produced = []
+
+        async def produce():
+            for i in range(10):
+                produced.append(i)
+                yield i
+
+        max_ahead = 0
+        received = []
+        async for item in manager.stream_in_loop(produce()):
+            await asyncio.sleep(0.01)
+            max_ahead = max(max_ahead, len(produced) - len(received))
+            received.append(item)
+
+        assert received == list(range(10))
+        # Queue size, plus the item being handed over, plus the one just taken off the queue
+        assert max_ahead <= 4
@@ -23,8 +23,8 @@ class TestCreateExecutorToolErrorHandling:
 
         fake_model = object()
         with patch.object(LangChainService, "_get_model", return_value=fake_model):
-            with patch("spaik_sdk.llm.langchain_service.create_react_agent") as mock_create:
-                with patch("spaik_sdk.llm.langchain_service.ToolNode") as mock_tool_node:
+            with patch("langgraph.prebuilt.create_react_agent") as mock_create:
+                with patch("langgraph.prebuilt.ToolNode") as mock_tool_node:
                     mock_tool_node.return_value = "tool-node-sentinel"
                     service.create_executor([sample_tool])
 
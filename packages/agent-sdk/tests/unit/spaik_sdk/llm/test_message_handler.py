@@ -98,3 +98,27 @@ class TestMessageHandler:
         assert len(thread.messages[0].blocks) == 1
         block = thread.messages[0].blocks[0]
         assert block.tool_call_args == {"query": "history", "limit": 5}
+
+    @pytest.mark.asyncio
+    async def test_process_agent_token_stream_yields_content_and_skips_unhandled_events(self):
+        thread = ThreadContainer(system_prompt="system prompt")
+        handler = MessageHandler(thread, assistant_name="assistant", assistant_id="assistant")
+
+        async def process_stream(_agent_stream):
+            yield StreamingEvent(event_type=EventType.MESSAGE_START, message_id="message-1")
+            yield StreamingEvent(
+                event_type=EventType.BLOCK_START, message_id="message-1", block_id="block-1", block_type=MessageBlockType.PLAIN
+            )
+            yield StreamingEvent(event_type=EventType.TOKEN, message_id="message-1", block_id="block-1", content="Hel")
+            yield StreamingEvent(event_type=EventType.ERROR, message_id="message-1", content="ignored")
+            yield StreamingEvent(event_type=EventType.TOKEN, message_id="message-1", block_id="block-1", content="lo")
+
+        handler.streaming_handler.process_stream = process_stream  # type: ignore[method-assign]
+
+        outputs = [output async for output in handler.process_agent_token_stream(fake_stream())]
+
+        assert outputs == [
+            {"type": "token", "content": "Hel", "block_id": "block-1", "message_id": "message-1"},
+            {"type": "token", "content": "lo", "block_id": "block-1", "message_id": "message-1"},
+        ]
+        assert thread.streaming_content["block-1"] == "Hello"
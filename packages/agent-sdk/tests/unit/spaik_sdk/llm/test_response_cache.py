@@ -0,0 +1,108 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from pydantic import BaseModel, create_model
+
+from spaik_sdk.llm.langchain_service import LangChainService
+from spaik_sdk.llm.response_cache import ResponseCache
+from spaik_sdk.models.providers.provider_type import ProviderType
+
+
+class Answer(BaseModel):
+    value: int
+
+
+def make_service(response_cache: ResponseCache, model: MagicMock, temperature: float = 0.1) -> LangChainService:
+    llm_config = MagicMock()
+    llm_config.model.name = "test-model"
+    llm_config.provider_type = ProviderType.ANTHROPIC
+    llm_config.provider = None
+    llm_config.reasoning = False
+    llm_config.reasoning_effort = "medium"
+    llm_config.reasoning_summary = "detailed"
+    llm_config.reasoning_budget_tokens = 4096
+    llm_config.max_output_tokens = None
+    llm_config.temperature = temperature
+    llm_config.get_model_wrapper.return_value.get_langchain_model.return_value = model
+    return LangChainService(
+        llm_config=llm_config,
+        thread_container=MagicMock(),
+        assistant_name="test-assistant",
+        assistant_id="test-id",
+        response_cache=response_cache,
+    )
+
+
+def make_model(value: int) -> MagicMock:
+    model = MagicMock()
+    model.with_structured_output.return_value.invoke.return_value = Answer(value=value)
+    model.with_structured_output.return_value.ainvoke = AsyncMock(return_value=Answer(value=value))
+    return model
+
+
+@pytest.mark.unit
+class TestResponseCache:
+    def test_get_returns_stored_value_and_counts_hits(self):
+        cache = ResponseCache(max_size=2)
+        cache.put("a", {"value": 1})
+
+        assert cache.get("a") == {"value": 1}
+        assert cache.get("b") is None
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+
+    def test_evicts_least_recently_used_entry(self):
+        cache = ResponseCache(max_size=2)
+        cache.put("a", {"value": 1})
+        cache.put("b", {"value": 2})
+        cache.get("a")
+        cache.put("c", {"value": 3})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"value": 1}
+        assert cache.get("c") == {"value": 3}
+
+    def test_make_key_separates_parts(self):
+        assert ResponseCache.make_key("ab", "c") != ResponseCache.make_key("a", "bc")
+
+    def test_structured_response_is_served_from_cache_on_repeat(self):
+        cache = ResponseCache()
+        model = make_model(42)
+        first = make_service(cache, model).get_structured_response("pick a number", Answer)
+        second = make_service(cache, model).get_structured_response("pick a number", Answer)
+
+        assert first == second == Answer(value=42)
+        assert model.with_structured_output.return_value.invoke.call_count == 1
+        assert cache.stats().hits == 1
+
+    def test_structured_response_bypasses_cache_when_recording(self):
+        cache = ResponseCache()
+        model = make_model(7)
+        service = make_service(cache, model)
+        service.recorder = MagicMock()
+
+        service.get_structured_response("pick a number", Answer)
+
+        assert cache.stats().size == 0
+
+    async def test_async_structured_response_awaits_the_model_and_shares_the_cache(self):
+        cache = ResponseCache()
+        model = make_model(42)
+        first = await make_service(cache, model).get_structured_response_async("pick a number", Answer)
+        second = make_service(cache, model).get_structured_response("pick a number", Answer)
+
+        assert first == second == Answer(value=42)
+        model.with_structured_output.return_value.ainvoke.assert_awaited_once_with("pick a number")
+        model.with_structured_output.return_value.invoke.assert_not_called()
+        assert cache.stats().hits == 1
+
+    def test_cache_key_depends_on_schema_and_model_settings(self):
+        cache = ResponseCache()
+        service = make_service(cache, make_model(1))
+        same_name = create_model("Answer", value=(str, ...))
+
+        key = service._get_structured_response_cache_key("pick a number", Answer)
+
+        assert service._get_structured_response_cache_key("pick a number", same_name) != key
+        assert make_service(cache, make_model(1), temperature=0.9)._get_structured_response_cache_key("pick a number", Answer) != key
+        assert make_service(cache, make_model(1))._get_structured_response_cache_key("pick a number", Answer) == key
@@ -0,0 +1,19 @@
+import pickle
+
+import pytest
+
+from spaik_sdk.llm.consumption.token_usage import TokenUsage
+
+
+@pytest.mark.unit
+class TestTokenUsage:
+    def test_pickle_round_trip(self):
+        usage = TokenUsage(input_tokens=3, output_tokens=4, reasoning_tokens=1)
+
+        assert pickle.loads(pickle.dumps(usage)) == usage
+
+    def test_restores_dict_state_from_before_slots(self):
+        usage = TokenUsage.__new__(TokenUsage)
+        usage.__setstate__({"input_tokens": 3, "output_tokens": 4, "total_tokens": 7, "reasoning_tokens": 1})
+
+        assert usage == TokenUsage(input_tokens=3, output_tokens=4, total_tokens=7, reasoning_tokens=1)
@@ -1,6 +1,7 @@
 import pytest
 
 from spaik_sdk.models.llm_families import LLMFamilies
+from spaik_sdk.models.llm_model import LLMModel
 from spaik_sdk.models.model_registry import ModelRegistry
 
 
@@ -126,3 +127,14 @@ class TestModelRegistry:
         assert "gemini-3.1-pro-preview" in model_names
         assert "gemini-3.1-flash-lite" in model_names
         assert "gemini-3.1-flash-lite-preview" in model_names
+
+    def test_registering_custom_model_invalidates_name_cache(self):
+        assert ModelRegistry.from_name("grok-4-fast-non").name == "grok-4-fast-non-reasoning"
+
+        custom = ModelRegistry.register_custom(LLMModel(family=LLMFamilies.XAI, name="grok-4-fast-non-custom"))
+        try:
+            with pytest.raises(ValueError, match="Ambiguous"):
+                ModelRegistry.from_name("grok-4-fast-non")
+        finally:
+            ModelRegistry._custom_models.discard(custom)
+            ModelRegistry._name_cache.clear()
@@ -0,0 +1,71 @@
+import os
+
+import pytest
+
+from spaik_sdk.agent.base_agent import BaseAgent
+from spaik_sdk.prompt import prompt_loader as prompt_loader_module
+from spaik_sdk.prompt.get_prompt_loader import get_prompt_loader
+from spaik_sdk.prompt.local_prompt_loader import LocalPromptLoader
+from spaik_sdk.prompt.prompt_loader_mode import PromptLoaderMode
+
+
+class PromptTestAgent(BaseAgent):
+    pass
+
+
+@pytest.fixture
+def prompts_dir(tmp_path):
+    agent_dir = tmp_path / "agent" / "PromptTestAgent"
+    agent_dir.mkdir(parents=True)
+    (agent_dir / "system.md").write_text("Hello {name}")
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestPromptLoader:
+    def test_system_prompt_is_loaded_from_disk_once(self, prompts_dir, monkeypatch):
+        loader = LocalPromptLoader(str(prompts_dir))
+        loads = []
+        load_raw_prompt = loader._load_raw_prompt
+        monkeypatch.setattr(loader, "_load_raw_prompt", lambda prompt_path: loads.append(prompt_path) or load_raw_prompt(prompt_path))
+
+        assert loader.get_system_prompt(PromptTestAgent, {"name": "Ada"}) == "Hello Ada"
+        assert loader.get_system_prompt(PromptTestAgent, {"name": "Ada"}) == "Hello Ada"
+        assert loader.get_system_prompt(PromptTestAgent, {"name": "Bob"}) == "Hello Bob"
+        assert loads == ["agent/PromptTestAgent/system"]
+
+    def test_edited_prompt_file_is_reloaded(self, prompts_dir):
+        loader = LocalPromptLoader(str(prompts_dir))
+        prompt_file = prompts_dir / "agent" / "PromptTestAgent" / "system.md"
+
+        assert loader.get_system_prompt(PromptTestAgent, {"name": "Ada"}) == "Hello Ada"
+        prompt_file.write_text("Hi {name}")
+        mtime_ns = prompt_file.stat().st_mtime_ns + 1_000_000_000
+        os.utime(prompt_file, ns=(mtime_ns, mtime_ns))
+
+        assert loader.get_system_prompt(PromptTestAgent, {"name": "Ada"}) == "Hi Ada"
+
+    def test_params_of_different_types_are_cached_separately(self, prompts_dir):
+        loader = LocalPromptLoader(str(prompts_dir))
+
+        assert loader.get_system_prompt(PromptTestAgent, {"name": 1}) == "Hello 1"
+        assert loader.get_system_prompt(PromptTestAgent, {"name": True}) == "Hello True"
+
+    def test_rendered_cache_is_bounded(self, prompts_dir, monkeypatch):
+        monkeypatch.setattr(prompt_loader_module, "_RENDERED_CACHE_MAX_ENTRIES", 2)
+        loader = LocalPromptLoader(str(prompts_dir))
+
+        for name in ["Ada", "Bob", "Cy"]:
+            loader.get_system_prompt(PromptTestAgent, {"name": name})
+
+        assert [dict((key, value) for key, _, value in params)["name"] for _, params in loader._rendered_cache] == ["Bob", "Cy"]
+
+    def test_unhashable_params_are_rendered_without_caching(self, prompts_dir):
+        loader = LocalPromptLoader(str(prompts_dir))
+
+        assert loader.get_system_prompt(PromptTestAgent, {"name": ["Ada"]}) == "Hello ['Ada']"
+
+    def test_get_prompt_loader_shares_loader_per_prompts_dir(self, prompts_dir, monkeypatch):
+        monkeypatch.setenv("PROMPTS_DIR", str(prompts_dir))
+
+        assert get_prompt_loader(PromptLoaderMode.LOCAL) is get_prompt_loader(PromptLoaderMode.LOCAL)
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+import pytest
+
+from spaik_sdk.server.storage.impl.local_file_thread_repository import LocalFileThreadRepository
+from spaik_sdk.thread.thread_container import ThreadContainer
+
+
+def _thread_version(thread_id: str, version: str) -> ThreadContainer:
+    thread = ThreadContainer(system_prompt=version)
+    thread.thread_id = thread_id
+    return thread
+
+
+def _slow_first_write(monkeypatch, repository: LocalFileThreadRepository) -> None:
+    write = repository._write_thread_and_metadata
+    calls = []
+
+    def slow_write(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            time.sleep(0.2)
+        write(*args)
+
+    monkeypatch.setattr(repository, "_write_thread_and_metadata", slow_write)
+
+
+@pytest.mark.unit
+class TestLocalFileThreadRepository:
+    async def test_concurrent_saves_land_in_call_order(self, tmp_path, monkeypatch):
+        repository = LocalFileThreadRepository(str(tmp_path))
+        _slow_first_write(monkeypatch, repository)
+
+        await asyncio.gather(
+            repository.save_thread(_thread_version("thread-1", "first")),
+            repository.save_thread(_thread_version("thread-1", "second")),
+        )
+
+        loaded = await repository.load_thread("thread-1")
+        assert loaded is not None
+        assert loaded.system_prompt == "second"
+        assert LocalFileThreadRepository(str(tmp_path)).get_thread_count() == 1
+
+    async def test_delete_waits_for_in_flight_save(self, tmp_path, monkeypatch):
+        repository = LocalFileThreadRepository(str(tmp_path))
+        await repository.save_thread(_thread_version("thread-1", "first"))
+        _slow_first_write(monkeypatch, repository)
+
+        _, deleted = await asyncio.gather(
+            repository.save_thread(_thread_version("thread-1", "second")),
+            repository.delete_thread("thread-1"),
+        )
+
+        assert deleted is True
+        assert await repository.load_thread("thread-1") is None
+        assert await repository.thread_exists("thread-1") is False
+        assert repository.get_thread_count() == 0
+
+    async def test_loads_during_saves_never_see_a_partial_file(self, tmp_path):
+        repository = LocalFileThreadRepository(str(tmp_path))
+        await repository.save_thread(_thread_version("thread-1", "0"))
+
+        async def save_versions():
+            for version in range(1, 20):
+                await repository.save_thread(_thread_version("thread-1", str(version)))
+
+        async def load_repeatedly():
+            return [await repository.load_thread("thread-1") for _ in range(20)]
+
+        _, loaded = await asyncio.gather(save_versions(), load_repeatedly())
+
+        assert all(thread is not None for thread in loaded)
+        assert list(tmp_path.glob("**/*.tmp")) == []
@@ -0,0 +1,35 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from spaik_sdk.server.app_factory import make_app
+
+
+@pytest.mark.unit
+class TestMakeApp:
+    def test_agent_is_created_and_routers_mounted_on_startup(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        agent_factory = MagicMock()
+        app = make_app(agent_factory, in_memory=True, include_files=True)
+
+        agent_factory.assert_not_called()
+        with TestClient(app) as client:
+            agent_factory.assert_called_once_with()
+            paths = client.get("/openapi.json").json()["paths"]
+
+        assert "/threads" in paths
+        assert "/files" in paths
+        assert not any(path.startswith("/audio") for path in paths)
+
+    def test_cors_headers_are_returned(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        app = make_app(MagicMock(), in_memory=True, cors_origins=["http://localhost:3000"])
+
+        with TestClient(app) as client:
+            response = client.options(
+                "/threads",
+                headers={"Origin": "http://localhost:3000", "Access-Control-Request-Method": "GET"},
+            )
+
+        assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
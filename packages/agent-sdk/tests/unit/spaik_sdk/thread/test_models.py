@@ -0,0 +1,37 @@
+import pickle
+
+import pytest
+
+from spaik_sdk.thread.models import MessageBlock, MessageBlockType, ThreadMessage
+
+
+def make_message() -> ThreadMessage:
+    return ThreadMessage(
+        id="message-1",
+        ai=True,
+        author_id="agent",
+        author_name="Agent",
+        timestamp=1,
+        blocks=[MessageBlock(id="block-1", streaming=False, type=MessageBlockType.PLAIN, content="hi")],
+    )
+
+
+@pytest.mark.unit
+class TestThreadModels:
+    def test_pickle_round_trip(self):
+        message = make_message()
+
+        assert pickle.loads(pickle.dumps(message)) == message
+
+    def test_restores_dict_state_from_before_slots(self):
+        block = MessageBlock.__new__(MessageBlock)
+        block.__setstate__({"id": "block-1", "streaming": False, "type": MessageBlockType.PLAIN, "content": "hi"})
+
+        assert block == MessageBlock(id="block-1", streaming=False, type=MessageBlockType.PLAIN, content="hi")
+        assert block.tool_name is None
+
+    def test_instances_have_no_dict(self):
+        message = make_message()
+
+        assert not hasattr(message, "__dict__")
+        assert not hasattr(message.blocks[0], "__dict__")
@@ -223,6 +223,17 @@ class TestThreadContainer:
 
         assert messages[1].content == '<tool_call tool="search_docs"/>'
 
+    def test_get_langchain_messages_marks_system_prompt_with_cache_control(self):
+        thread = ThreadContainer(system_prompt="system prompt")
+
+        plain = thread.get_langchain_messages()
+        cached = thread.get_langchain_messages(cache_control={"type": "ephemeral"})
+
+        assert isinstance(plain[0], SystemMessage)
+        assert plain[0].content == "system prompt"
+        assert isinstance(cached[0], SystemMessage)
+        assert cached[0].content == [{"type": "text", "text": "system prompt", "cache_control": {"type": "ephemeral"}}]
+
     @pytest.mark.asyncio
     async def test_get_langchain_messages_multimodal_uses_provider_tool_history_override(self):
         provider = CustomHistoryToolProvider()
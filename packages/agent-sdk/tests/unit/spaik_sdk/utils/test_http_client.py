@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from spaik_sdk.utils.http_client import close_http_client, get_http_client, post, stream_post
+
+
+@pytest.mark.unit
+class TestHttpClient:
+    async def test_client_is_reused_on_the_same_loop(self):
+        first = get_http_client()
+        second = get_http_client()
+
+        assert first is second
+        await close_http_client()
+        assert first.is_closed
+        assert get_http_client() is not first
+        await close_http_client()
+
+    def test_each_event_loop_gets_its_own_client(self):
+        async def get_and_close():
+            client = get_http_client()
+            await close_http_client()
+            return client
+
+        assert asyncio.run(get_and_close()) is not asyncio.run(get_and_close())
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["httpx", "aiohttp"])
+async def test_post_sends_multipart_form_with_each_backend(backend, monkeypatch):
+    web = pytest.importorskip("aiohttp.web")
+    monkeypatch.setenv("HTTP_CLIENT_BACKEND", backend)
+    received = {}
+
+    async def handle(request):
+        form = await request.post()
+        received["model"] = form["model"]
+        received["file"] = (form["file"].filename, form["file"].content_type, form["file"].file.read())
+        received["auth"] = request.headers["Authorization"]
+        return web.Response(text="hello ")
+
+    app = web.Application()
+    app.router.add_post("/transcribe", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        response = await post(
+            f"http://127.0.0.1:{port}/transcribe",
+            {"Authorization": "Bearer key"},
+            files={"file": ("audio.wav", b"RIFF", "audio/wav")},
+            data={"model": "whisper-1"},
+        )
+    finally:
+        await close_http_client()
+        await runner.cleanup()
+
+    assert response.status_code == 200
+    assert response.text == "hello "
+    assert received == {"model": "whisper-1", "file": ("audio.wav", "audio/wav", b"RIFF"), "auth": "Bearer key"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("backend", ["httpx", "aiohttp"])
+async def test_stream_post_streams_the_body_with_each_backend(backend, monkeypatch):
+    web = pytest.importorskip("aiohttp.web")
+    monkeypatch.setenv("HTTP_CLIENT_BACKEND", backend)
+
+    async def speech(request):
+        payload = await request.json()
+        response = web.StreamResponse()
+        await response.prepare(request)
+        for word in payload["input"].split():
+            await response.write(word.encode())
+        await response.write_eof()
+        return response
+
+    async def error(request):
+        return web.Response(status=429, text="slow down")
+
+    app = web.Application()
+    app.router.add_post("/speech", speech)
+    app.router.add_post("/error", error)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        async with stream_post(f"http://127.0.0.1:{port}/speech", {"Authorization": "Bearer key"}, json={"input": "a b c"}) as response:
+            status_code = response.status_code
+            body = b"".join([chunk async for chunk in response.aiter_bytes(4096)])
+        async with stream_post(f"http://127.0.0.1:{port}/error", {}, json={}) as error_response:
+            error_status, error_body = error_response.status_code, await error_response.aread()
+    finally:
+        await close_http_client()
+        await runner.cleanup()
+
+    assert (status_code, body) == (200, b"abc")
+    assert (error_status, error_body) == (429, b"slow down")
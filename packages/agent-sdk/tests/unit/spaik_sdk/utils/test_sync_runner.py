@@ -0,0 +1,39 @@
+import asyncio
+import gc
+import threading
+
+import pytest
+
+from spaik_sdk.utils.sync_runner import run_sync
+
+
+async def current_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+@pytest.mark.unit
+class TestRunSync:
+    def test_reuses_the_same_loop_across_calls(self):
+        assert run_sync(current_loop()) is run_sync(current_loop())
+
+    @pytest.mark.asyncio
+    async def test_raises_inside_running_loop(self):
+        with pytest.raises(RuntimeError, match="running event loop"):
+            run_sync(current_loop())
+
+    def test_cancels_tasks_left_behind_by_the_call(self):
+        async def leave_task_behind() -> asyncio.Task:
+            return asyncio.ensure_future(asyncio.sleep(60))
+
+        task = run_sync(leave_task_behind())
+
+        assert task.cancelled()
+
+    def test_closes_the_loop_when_its_thread_exits(self):
+        loops = []
+        thread = threading.Thread(target=lambda: loops.append(run_sync(current_loop())))
+        thread.start()
+        thread.join()
+        gc.collect()
+
+        assert loops[0].is_closed()
@@ -1,28 +1,14 @@
 from typing import List
 import uvicorn
 from dotenv import load_dotenv
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 
 from spaik_sdk.agent.base_agent import BaseAgent
 from spaik_sdk.tools.tool_provider import ToolProvider, tool, BaseTool
-from spaik_sdk.server.api.routers.api_builder import ApiBuilder
+from spaik_sdk.server.app_factory import make_app
 from spaik_sdk.models.model_registry import ModelRegistry
 
 load_dotenv()
 
-# FastAPI app
-app = FastAPI(title="Agent SDK Backend Example", version="0.0.1")
-
-# Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 class DemoTool(ToolProvider):
     def get_tools(self) -> List[BaseTool]:
         @tool
@@ -44,14 +30,10 @@ class DemoAgent(BaseAgent):
 class MinimalAgent(BaseAgent):
     pass
 
-@app.on_event("startup")
-async def startup_event():
-
-    agent = DemoAgent(llm_model=ModelRegistry.CLAUDE_4_SONNET)
-    
-    api_builder = ApiBuilder.local(agent=agent)
-    thread_router = api_builder.build_thread_router()
-    app.include_router(thread_router)
+app = make_app(
+    lambda: DemoAgent(llm_model=ModelRegistry.CLAUDE_4_SONNET),
+    title="Agent SDK Backend Example",
+)
 
 
 def run_server():